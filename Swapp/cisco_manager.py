@@ -1,15 +1,20 @@
-#!/usr/bin/env python3
+#!/usr/bin/env python3
 """
 Professional Cisco Device Management Module
 Enterprise-grade Cisco switch management with comprehensive error handling and logging.
 """
 
+import io
 import re
 import time
+import atexit
+import hashlib
 import logging
 import threading
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+import functools
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple, Any
 from netmiko import ConnectHandler
 from netmiko.exceptions import NetmikoTimeoutException, NetmikoAuthenticationException
 
@@ -24,10 +29,199 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Precompiled parser patterns
+_RE_VERSION_ALL = re.compile(
+    r'(?P<hostname>\S+) uptime is\s+(?P<uptime>.+)'
+    r'|(?i:Model number\s*:\s*(?P<model>.+))'
+    r'|(?i:System serial number\s*:\s*(?P<serial>\S+))'
+    r'|Version\s+(?P<ios_version>\S+)'
+)
+_VERSION_FIELDS = ('hostname', 'model', 'serial', 'ios_version', 'uptime')
+_MODEL_FALLBACK_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'cisco\s+(\S+)\s+\(',
+    r'Hardware:\s*(\S+)'
+))
+_RE_SERIAL_FALLBACK = re.compile(r'Processor board ID\s+(\S+)', re.IGNORECASE)
+_RE_SWITCHPORT_NAME = re.compile(r'^[ \t]*Name:[ \t]*(\S+)', re.M)
+_RE_ACCESS_VLAN = re.compile(r'Access Mode VLAN:\s*(\d+)')
+_CPU_PATTERNS = (re.compile(r'five seconds:\s*(\d+)%'), re.compile(r'(\d+)%'))
+_RE_MEM = re.compile(r'Total:\s*(\d+).*?Used:\s*(\d+)')
+# One row of 'show interfaces status'; header and separator lines never match
+_RE_IF_STATUS_ROW = re.compile(
+    r'^[ \t]*(?!Port|-)(?P<intf>\S+)[ \t]+(?P<status>\S+)[ \t]+(?P<vlan>\S+)[ \t]+(?P<duplex>\S+)'
+    r'(?:[ \t]+(?P<speed>\S+))?(?:[ \t]+(?P<type>\S.*?))?[ \t]*\r?$', re.M)
+_RE_IFACE_HEADER = re.compile(
+    r'^[ \t]*((?:GigabitEthernet|FastEthernet|TenGigabitEthernet)\S*)(.*)$', re.M)
+_RE_PKTS_IN = re.compile(r'^\s*(\d+) packets input, (\d+) bytes', re.M)
+_RE_PKTS_OUT = re.compile(r'^\s*(\d+) packets output, (\d+) bytes', re.M)
+_RE_MAC_ROW = re.compile(r'^[ \t]*(\d+)[ \t]+([0-9a-fA-F.:-]+)[ \t]+(\S+)[ \t]+(\S+)', re.M)
+_RE_ARP_ROW = re.compile(
+    r'^[ \t]*Internet[ \t]+(\S+)[ \t]+(\S+)[ \t]+([0-9a-fA-F.:-]+)[ \t]+(\S+)[ \t]+(\S+)', re.M)
+
+# Read-only commands collected in one round trip by get_comprehensive_status
+_STATUS_COMMANDS = [
+    "show interfaces status",
+    "show interfaces switchport",
+    "show vlan brief",
+    "show processes cpu sorted",
+    "show memory statistics"
+]
+
+# Netmiko session settings shared by every connection
+_DEFAULT_DEVICE_CONFIG = MappingProxyType({
+    'timeout': 60,
+    'session_timeout': 60,
+    'global_delay_factor': 2,
+    'conn_timeout': 30
+})
+
+# Extra time a timed-out batch gets to finish printing before its leftovers are discarded
+BATCH_DRAIN_TIMEOUT = 5
+
+# Connection pool settings (seconds)
+CONNECTION_POOL_IDLE_TIMEOUT = 300
+CONNECTION_POOL_MAX_AGE = 3600
+CONNECTION_POOL_MAX_SIZE = 16
+CONNECTION_POOL_REVALIDATE_AFTER = 30
+
+# How long volatile status results are reused between refreshes (seconds)
+STATUS_CACHE_TTL = 2.0
+RUNNING_CONFIG_CACHE_TTL = 10.0
+DEVICE_INFO_CACHE_TTL = 60.0
+
 class CiscoManagerError(Exception):
     """Custom exception for Cisco Manager operations"""
     pass
 
+class _ConnectionPool:
+    """Keeps authenticated device sessions alive between connect/disconnect cycles"""
+    
+    def __init__(self, idle_timeout: float, max_age: float, max_size: int):
+        self.idle_timeout = idle_timeout
+        self.max_age = max_age
+        self.max_size = max_size
+        self._lock = threading.RLock()
+        self._entries = {}
+        self._created = {}
+        self._reaper = None
+    
+    def get(self, key: tuple, factory) -> Tuple[Any, Optional[Dict[str, str]]]:
+        """Return (connection, cached device info) for key, building a new session on miss"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        
+        if entry:
+            now = time.monotonic()
+            expired = now - entry['created'] > self.max_age or now - entry['last_used'] > self.idle_timeout
+            stale = now - entry['last_used'] > CONNECTION_POOL_REVALIDATE_AFTER
+            if not expired and (not stale or self._is_alive(entry['connection'])):
+                logger.info("Reusing pooled connection to %s", key[0])
+                with self._lock:
+                    self._created[id(entry['connection'])] = entry['created']
+                return entry['connection'], (None if stale else entry['device_info'])
+            self._close(entry['connection'])
+        
+        connection = factory()
+        with self._lock:
+            self._created[id(connection)] = time.monotonic()
+        return connection, None
+    
+    def release(self, key: tuple, connection, device_info: Dict[str, str]):
+        """Return a live session to the pool for later reuse"""
+        now = time.monotonic()
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous:
+                self._close(previous['connection'])
+            
+            if len(self._entries) >= self.max_size:
+                oldest = min(self._entries, key=lambda k: self._entries[k]['last_used'])
+                self._close(self._entries.pop(oldest)['connection'])
+            
+            self._entries[key] = {
+                'connection': connection,
+                'device_info': dict(device_info),
+                'created': self._created.pop(id(connection), now),
+                'last_used': now
+            }
+            self._schedule_reaper()
+    
+    def discard(self, connection):
+        """Close a session that must not be reused"""
+        with self._lock:
+            self._created.pop(id(connection), None)
+        self._close(connection)
+    
+    def close_all(self):
+        """Close every pooled session"""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            if self._reaper:
+                self._reaper.cancel()
+                self._reaper = None
+        
+        for entry in entries:
+            self._close(entry['connection'])
+    
+    def _schedule_reaper(self):
+        if self._reaper is None and self._entries:
+            self._reaper = threading.Timer(CONNECTION_POOL_REVALIDATE_AFTER, self._reap)
+            self._reaper.daemon = True
+            self._reaper.start()
+    
+    def _reap(self):
+        """Close sessions that have been idle or alive for too long"""
+        now = time.monotonic()
+        with self._lock:
+            self._reaper = None
+            expired = [key for key, entry in self._entries.items()
+                       if now - entry['last_used'] > self.idle_timeout
+                       or now - entry['created'] > self.max_age]
+            closing = [self._entries.pop(key)['connection'] for key in expired]
+            self._schedule_reaper()
+        
+        for connection in closing:
+            self._close(connection)
+    
+    @staticmethod
+    def _is_alive(connection) -> bool:
+        try:
+            return connection.is_alive()
+        except Exception:
+            return False
+    
+    @staticmethod
+    def _close(connection):
+        try:
+            connection.disconnect()
+        except Exception as e:
+            logger.debug("Error closing pooled connection: %s", e)
+
+_CONNECTION_POOL = _ConnectionPool(
+    CONNECTION_POOL_IDLE_TIMEOUT,
+    CONNECTION_POOL_MAX_AGE,
+    CONNECTION_POOL_MAX_SIZE
+)
+atexit.register(_CONNECTION_POOL.close_all)
+
+def _ttl_cached(seconds: float):
+    """Cache a CiscoManager getter result on the instance for the given number of seconds"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self):
+            with self.connection_lock:
+                entry = self._cache.get(func.__name__)
+            if entry and entry[1] > time.monotonic():
+                return entry[0]
+            
+            value = func(self)
+            with self.connection_lock:
+                self._cache[func.__name__] = (value, time.monotonic() + seconds)
+            return value
+        return wrapper
+    return decorator
+
 class CiscoManager:
     """Professional Cisco device management class"""
     
@@ -36,145 +230,178 @@ class CiscoManager:
         self.connection = None
         self.connected = False
         self.device_info = {}
+        self._pool_key = None
+        self._cache = {}
+        self._show_version_cache = None
         self.callbacks = {}
         self.last_error = None
-        self.connection_lock = threading.Lock()
+        self.connection_lock = threading.RLock()
         logger.info("CiscoManager initialized")
     
     def register_callback(self, event: str, callback):
         """Register callback for events"""
-        if event not in self.callbacks:
-            self.callbacks[event] = []
-        self.callbacks[event].append(callback)
-        logger.debug(f"Callback registered for event: {event}")
+        # Callbacks are stored as tuples so triggering can iterate without copying
+        with self.connection_lock:
+            self.callbacks[event] = self.callbacks.get(event, ()) + (callback,)
+        logger.debug("Callback registered for event: %s", event)
     
     def trigger_callback(self, event: str, data: Any = None):
         """Trigger registered callbacks"""
-        try:
-            if event in self.callbacks:
-                for callback in self.callbacks[event]:
-                    if callable(callback):
-                        callback(data)
-        except Exception as e:
-            logger.error(f"Error triggering callback for {event}: {e}")
+        for callback in self.callbacks.get(event, ()):
+            try:
+                callback(data)
+            except Exception:
+                logger.exception("Error triggering callback for %s", event)
     
     def connect(self, host: str, username: str, password: str, 
                 device_type: str = 'cisco_ios', port: int = 22, 
                 secret: Optional[str] = None) -> bool:
         """Establish connection to Cisco device"""
-        with self.connection_lock:
-            try:
-                logger.info(f"Attempting to connect to {host}:{port}")
-                
-                device_config = {
-                    'device_type': device_type,
-                    'host': host,
-                    'username': username,
-                    'password': password,
-                    'port': port,
-                    'timeout': 60,
-                    'session_timeout': 60,
-                    'global_delay_factor': 2,
-                    'conn_timeout': 30
-                }
-                
-                if secret:
-                    device_config['secret'] = secret
-                
-                self.connection = ConnectHandler(**device_config)
-                
-                # Test connection
-                test_output = self.connection.send_command('show version', delay_factor=2)
-                if not test_output or 'Invalid' in test_output:
-                    raise CiscoManagerError("Connection test failed")
+        try:
+            logger.info("Attempting to connect to %s:%s", host, port)
+            
+            device_config = {
+                **_DEFAULT_DEVICE_CONFIG,
+                'device_type': device_type,
+                'host': host,
+                'username': username,
+                'password': password,
+                'port': port
+            }
+            
+            if secret:
+                device_config['secret'] = secret
+            
+            def open_connection():
+                connection = ConnectHandler(**device_config)
                 
                 if secret:
-                    self.connection.enable()
+                    try:
+                        connection.enable()
+                    except Exception:
+                        connection.disconnect()
+                        raise
                     logger.info("Entered enable mode")
                 
+                return connection
+            
+            # Sessions are only shared between identical credentials and privilege levels;
+            # the password and secret are kept in the key as a digest, never in clear
+            credentials = hashlib.sha256(f"{password}\0{secret or ''}".encode()).hexdigest()
+            pool_key = (host, port, username, device_type, bool(secret), credentials)
+            
+            # The SSH handshake runs without holding the lock
+            connection, cached_info = _CONNECTION_POOL.get(pool_key, open_connection)
+            
+            with self.connection_lock:
+                self.connection = connection
+                self._pool_key = pool_key
                 self.connected = True
                 self.last_error = None
-                self.device_info = self._get_basic_device_info()
-                
-                logger.info(f"Successfully connected to {host}")
-                self.trigger_callback('connected', self.device_info)
-                return True
-                
-            except Exception as e:
-                error_msg = f"Connection failed: {str(e)}"
-                logger.error(error_msg)
-                self.last_error = error_msg
-                self.trigger_callback('connection_failed', error_msg)
-                return False
-    
-    def disconnect(self) -> bool:
-        """Safely disconnect from device"""
-        with self.connection_lock:
-            try:
-                if self.connection:
-                    self.connection.disconnect()
-                    logger.info("Disconnected from device")
-                
+                self._cache.clear()
+                self._show_version_cache = None
+            
+            # Reading show version doubles as the connection test
+            device_info = cached_info or self._get_basic_device_info(validate=True)
+            with self.connection_lock:
+                self.device_info = device_info
+            
+            logger.info("Successfully connected to %s", host)
+            self.trigger_callback('connected', device_info)
+            return True
+            
+        except Exception as e:
+            with self.connection_lock:
+                failed_connection = self.connection if self.connected else None
                 self.connection = None
+                self._pool_key = None
                 self.connected = False
-                self.device_info = {}
-                self.trigger_callback('disconnected')
-                return True
-                
-            except Exception as e:
-                logger.error(f"Error during disconnect: {e}")
-                return False
+            if failed_connection:
+                _CONNECTION_POOL.discard(failed_connection)
+            
+            error_msg = f"Connection failed: {str(e)}"
+            logger.error(error_msg)
+            self.last_error = error_msg
+            self.trigger_callback('connection_failed', error_msg)
+            return False
     
-    def _get_basic_device_info(self) -> Dict[str, str]:
-        """Get basic device information"""
+    def disconnect(self, keep_alive: bool = False) -> bool:
+        """Safely disconnect from device; keep_alive returns the session to the pool instead of closing it"""
         try:
-            version_output = self.send_command("show version")
-            info = {}
-            
-            # Parse hostname
-            hostname_match = re.search(r'(\S+) uptime is', version_output)
-            if hostname_match:
-                info['hostname'] = hostname_match.group(1)
-            
-            # Parse model
-            model_patterns = [
-                r'Model number\s*:\s*(.+)',
-                r'cisco\s+(\S+)\s+\(',
-                r'Hardware:\s*(\S+)'
-            ]
-            for pattern in model_patterns:
-                match = re.search(pattern, version_output, re.IGNORECASE)
-                if match:
-                    info['model'] = match.group(1).strip()
-                    break
+            with self.connection_lock:
+                connection, pool_key, device_info = self.connection, self._pool_key, self.device_info
+                self.connection = None
+                self._pool_key = None
+                self._cache.clear()
+                self._show_version_cache = None
+                self.connected = False
+                self.device_info = {}
             
-            # Parse serial number
-            serial_patterns = [
-                r'System serial number\s*:\s*(\S+)',
-                r'Processor board ID\s+(\S+)'
-            ]
-            for pattern in serial_patterns:
-                match = re.search(pattern, version_output, re.IGNORECASE)
-                if match:
-                    info['serial'] = match.group(1).strip()
-                    break
+            if connection:
+                if keep_alive and pool_key:
+                    _CONNECTION_POOL.release(pool_key, connection, device_info)
+                    logger.info("Returned device session to connection pool")
+                else:
+                    _CONNECTION_POOL.discard(connection)
+                    logger.info("Disconnected from device")
+            
+            self.trigger_callback('disconnected')
+            return True
+            
+        except Exception as e:
+            logger.error("Error during disconnect: %s", e)
+            return False
+    
+    def _get_basic_device_info(self, validate: bool = False) -> Dict[str, str]:
+        """Get basic device information; with validate, failures raise instead of returning {}"""
+        try:
+            cached = self._show_version_cache
+            if cached and time.monotonic() - cached[2] < DEVICE_INFO_CACHE_TTL:
+                return dict(cached[1])
             
-            # Parse IOS version
-            ios_match = re.search(r'Version\s+(\S+)', version_output)
-            if ios_match:
-                info['ios_version'] = ios_match.group(1)
+            version_output = self.send_command("show version")
+            if not version_output or 'Invalid' in version_output:
+                raise CiscoManagerError("Connection test failed")
             
-            # Parse uptime
-            uptime_match = re.search(r'uptime is\s+(.+)', version_output)
-            if uptime_match:
-                info['uptime'] = uptime_match.group(1).strip()
+            if cached and cached[0] == version_output:
+                info = cached[1]
+            else:
+                info = self._parse_version(version_output)
             
-            return info
+            self._show_version_cache = (version_output, info, time.monotonic())
+            return dict(info)
             
         except Exception as e:
-            logger.error(f"Error getting device info: {e}")
+            if validate:
+                raise
+            logger.error("Error getting device info: %s", e)
             return {}
     
+    def _parse_version(self, version_output: str) -> Dict[str, str]:
+        """Parse 'show version' output"""
+        found = {}
+            
+        # Single pass over the output; first occurrence of each field wins
+        for match in _RE_VERSION_ALL.finditer(version_output):
+            for key, value in match.groupdict().items():
+                if value is not None and key not in found:
+                    found[key] = value.strip()
+        
+        # Secondary model/serial formats, only when the primary one is missing
+        if 'model' not in found:
+            for pattern in _MODEL_FALLBACK_PATTERNS:
+                match = pattern.search(version_output)
+                if match:
+                    found['model'] = match.group(1).strip()
+                    break
+        
+        if 'serial' not in found:
+            match = _RE_SERIAL_FALLBACK.search(version_output)
+            if match:
+                found['serial'] = match.group(1).strip()
+        
+        return {key: found[key] for key in _VERSION_FIELDS if key in found}
+    
     def send_command(self, command: str, expect_string: Optional[str] = None, 
                     delay_factor: int = 1) -> str:
         """Send command to device with error handling"""
@@ -182,7 +409,7 @@ class CiscoManager:
             raise CiscoManagerError("Device not connected")
         
         try:
-            logger.debug(f"Sending command: {command}")
+            logger.debug("Sending command: %s", command)
             output = self.connection.send_command(
                 command, 
                 expect_string=expect_string,
@@ -202,8 +429,10 @@ class CiscoManager:
             raise CiscoManagerError("Device not connected")
         
         try:
-            logger.info(f"Sending config commands: {commands}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Sending config commands: %r", commands)
             output = self.connection.send_config_set(commands)
+            self.clear_cache()
             logger.info("Configuration commands sent successfully")
             return output
             
@@ -212,12 +441,18 @@ class CiscoManager:
             logger.error(error_msg)
             raise CiscoManagerError(error_msg)
     
+    def clear_cache(self):
+        """Drop cached status results so the next call queries the device"""
+        with self.connection_lock:
+            self._cache.clear()
+    
     def get_device_info(self) -> Dict[str, str]:
         """Get comprehensive device information"""
         if not self.device_info:
             self.device_info = self._get_basic_device_info()
         return self.device_info.copy()
     
+    @_ttl_cached(STATUS_CACHE_TTL)
     def get_interfaces_status(self) -> Dict[str, Dict[str, str]]:
         """Get comprehensive interface status information"""
         try:
@@ -241,45 +476,28 @@ class CiscoManager:
             return interfaces
             
         except Exception as e:
-            logger.error(f"Error getting interface status: {e}")
+            logger.error("Error getting interface status: %s", e)
             return {}
     
     def _parse_interface_status(self, output: str) -> Dict[str, Dict[str, str]]:
         """Parse 'show interfaces status' output"""
-        interfaces = {}
-        lines = output.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith('Port') or line.startswith('-'):
-                continue
-            
-            parts = line.split()
-            if len(parts) >= 4:
-                interface = parts[0]
-                status = parts[1] if len(parts) > 1 else 'unknown'
-                vlan = parts[2] if len(parts) > 2 else 'unknown'
-                duplex = parts[3] if len(parts) > 3 else 'unknown'
-                speed = parts[4] if len(parts) > 4 else 'unknown'
-                port_type = ' '.join(parts[5:]) if len(parts) > 5 else 'unknown'
-                
-                interfaces[interface] = {
-                    'status': status,
-                    'vlan': vlan,
-                    'duplex': duplex,
-                    'speed': speed,
-                    'type': port_type,
-                    'description': ''
-                }
-        
-        return interfaces
+        return {
+            match['intf']: {
+                'status': match['status'],
+                'vlan': match['vlan'],
+                'duplex': match['duplex'],
+                'speed': match['speed'] or 'unknown',
+                'type': match['type'] or 'unknown',
+                'description': ''
+            }
+            for match in _RE_IF_STATUS_ROW.finditer(output)
+        }
     
     def _parse_interface_brief(self, output: str) -> Dict[str, Dict[str, str]]:
         """Parse 'show ip interface brief' output"""
         interfaces = {}
-        lines = output.split('\n')
         
-        for line in lines:
+        for line in io.StringIO(output):
             line = line.strip()
             if not line or 'Interface' in line or line.startswith('-'):
                 continue
@@ -300,27 +518,47 @@ class CiscoManager:
         
         return interfaces
     
-    def _enrich_with_switchport_info(self, interfaces: Dict[str, Dict[str, str]]):
+    def _enrich_with_switchport_info(self, interfaces: Dict[str, Dict[str, str]],
+                                     switchport_output: Optional[str] = None):
         """Enrich interface information with switchport details"""
         try:
-            switchport_output = self.send_command("show interfaces switchport")
-            current_interface = None
-            
-            for line in switchport_output.split('\n'):
-                line = line.strip()
+            if switchport_output is None:
+                switchport_output = self.send_command("show interfaces switchport")
+            names = list(_RE_SWITCHPORT_NAME.finditer(switchport_output))
+            
+            for index, name_match in enumerate(names):
+                current_interface = name_match.group(1)
+                if current_interface not in interfaces:
+                    continue
                 
-                if line.startswith('Name:'):
-                    current_interface = line.split('Name:')[1].strip()
-                elif 'Access Mode VLAN:' in line and current_interface:
-                    vlan_match = re.search(r'Access Mode VLAN:\s*(\d+)', line)
-                    if vlan_match and current_interface in interfaces:
-                        interfaces[current_interface]['vlan'] = vlan_match.group(1)
+                # Only look for the VLAN inside this interface's section
+                section_end = names[index + 1].start() if index + 1 < len(names) else len(switchport_output)
+                vlan_match = _RE_ACCESS_VLAN.search(switchport_output, name_match.end(), section_end)
+                if vlan_match:
+                    interfaces[current_interface]['vlan'] = vlan_match.group(1)
         
         except Exception:
             pass
     
+    @_ttl_cached(STATUS_CACHE_TTL)
     def get_cpu_memory_usage(self) -> Dict[str, Any]:
         """Get CPU and memory usage"""
+        cpu_output = memory_output = ''
+        
+        try:
+            cpu_output = self.send_command("show processes cpu sorted")
+        except Exception:
+            pass
+        
+        try:
+            memory_output = self.send_command("show memory statistics")
+        except Exception:
+            pass
+        
+        return self._parse_cpu_memory(cpu_output, memory_output)
+    
+    def _parse_cpu_memory(self, cpu_output: str, memory_output: str) -> Dict[str, Any]:
+        """Parse 'show processes cpu sorted' and 'show memory statistics' output"""
         try:
             cpu_info = {
                 'cpu_usage': 'N/A',
@@ -329,14 +567,12 @@ class CiscoManager:
                 'used_memory': 0
             }
             
-            # Get CPU usage
+            # Parse CPU usage
             try:
-                cpu_output = self.send_command("show processes cpu sorted")
-                for line in cpu_output.split('\n'):
+                for line in io.StringIO(cpu_output):
                     if 'CPU utilization' in line:
-                        patterns = [r'five seconds:\s*(\d+)%', r'(\d+)%']
-                        for pattern in patterns:
-                            match = re.search(pattern, line)
+                        for pattern in _CPU_PATTERNS:
+                            match = pattern.search(line)
                             if match:
                                 cpu_info['cpu_usage'] = f"{match.group(1)}%"
                                 break
@@ -345,24 +581,23 @@ class CiscoManager:
             except Exception:
                 pass
             
-            # Get memory usage
+            # Parse memory usage
             try:
-                memory_output = self.send_command("show memory statistics")
-                for line in memory_output.split('\n'):
-                    if 'Processor Pool' in line or 'Head' in line:
-                        total_match = re.search(r'Total:\s*(\d+)', line)
-                        used_match = re.search(r'Used:\s*(\d+)', line)
+                for line in io.StringIO(memory_output):
+                    if 'Processor Pool' not in line and 'Head' not in line:
+                        continue
+                    
+                    mem_match = _RE_MEM.search(line)
+                    if mem_match:
+                        total_mem = int(mem_match.group(1))
+                        used_mem = int(mem_match.group(2))
+                        cpu_info['total_memory'] = total_mem
+                        cpu_info['used_memory'] = used_mem
                         
-                        if total_match and used_match:
-                            total_mem = int(total_match.group(1))
-                            used_mem = int(used_match.group(1))
-                            cpu_info['total_memory'] = total_mem
-                            cpu_info['used_memory'] = used_mem
-                            
-                            if total_mem > 0:
-                                usage_pct = (used_mem / total_mem) * 100
-                                cpu_info['memory_usage'] = f"{usage_pct:.1f}%"
-                            break
+                        if total_mem > 0:
+                            usage_pct = (used_mem / total_mem) * 100
+                            cpu_info['memory_usage'] = f"{usage_pct:.1f}%"
+                        break
             except Exception:
                 pass
             
@@ -376,6 +611,55 @@ class CiscoManager:
                 'used_memory': 0
             }
     
+    def send_commands_batched(self, commands: List[str], read_timeout: float = 60) -> Dict[str, str]:
+        """Send several show commands in a single write and split the combined output per command"""
+        if not self.connected or not self.connection:
+            raise CiscoManagerError("Device not connected")
+        
+        try:
+            logger.debug("Sending batched commands: %r", commands)
+            prompt = self.connection.find_prompt()
+            self.connection.write_channel(''.join(f"{command}\n" for command in commands))
+            
+            # The device prints its prompt once after every command
+            raw = ''
+            deadline = time.monotonic() + read_timeout
+            while raw.count(prompt) < len(commands) or not raw.rstrip().endswith(prompt):
+                if time.monotonic() > deadline:
+                    self._drain_batch(prompt, len(commands) - raw.count(prompt))
+                    raise CiscoManagerError("Timed out waiting for batched command output")
+                chunk = self.connection.read_channel()
+                if chunk:
+                    raw += chunk
+                else:
+                    time.sleep(0.05)
+            
+            sections = raw.replace('\r\n', '\n').split(prompt)
+            outputs = {}
+            for command, section in zip(commands, sections):
+                # First line of each section is the echoed command
+                outputs[command] = section.split('\n', 1)[1] if '\n' in section else ''
+            return outputs
+            
+        except CiscoManagerError:
+            raise
+        except Exception as e:
+            error_msg = f"Batched commands {commands} failed: {str(e)}"
+            logger.error(error_msg)
+            raise CiscoManagerError(error_msg)
+    
+    def _drain_batch(self, prompt: str, prompts_left: int) -> None:
+        """Consume what is left of a timed-out batch so later commands start on a clean channel"""
+        raw = ''
+        deadline = time.monotonic() + BATCH_DRAIN_TIMEOUT
+        while raw.count(prompt) < prompts_left and time.monotonic() < deadline:
+            chunk = self.connection.read_channel()
+            if chunk:
+                raw += chunk
+            else:
+                time.sleep(0.05)
+        self.connection.clear_buffer()
+    
     def get_comprehensive_status(self) -> Dict[str, Any]:
         """Get comprehensive device status"""
         status_data = {
@@ -389,6 +673,23 @@ class CiscoManager:
             'cpu_memory': {}
         }
         
+        try:
+            outputs = self.send_commands_batched(_STATUS_COMMANDS)
+        except Exception as e:
+            logger.warning("Batched status collection failed, using individual commands: %s", e)
+        else:
+            interfaces = self._parse_interface_status(outputs["show interfaces status"])
+            if interfaces:
+                self._enrich_with_switchport_info(interfaces, outputs["show interfaces switchport"])
+            else:
+                interfaces = self.get_interfaces_status()
+            status_data['interfaces'] = interfaces
+            status_data['vlans'], status_data['interface_vlans'] = self._parse_vlan_brief(
+                outputs["show vlan brief"])
+            status_data['cpu_memory'] = self._parse_cpu_memory(
+                outputs["show processes cpu sorted"], outputs["show memory statistics"])
+            return status_data
+        
         try:
             status_data['interfaces'] = self.get_interfaces_status()
         except Exception:
@@ -408,21 +709,24 @@ class CiscoManager:
         
         return status_data
     
+    @_ttl_cached(STATUS_CACHE_TTL)
     def get_detailed_vlan_info(self) -> Tuple[Dict[str, Dict], Dict[str, str]]:
         """Get detailed VLAN information"""
         try:
-            vlan_output = self.send_command("show vlan brief")
+            return self._parse_vlan_brief(self.send_command("show vlan brief"))
+        except Exception:
+            return {}, {}
+    
+    def _parse_vlan_brief(self, vlan_output: str) -> Tuple[Dict[str, Dict], Dict[str, str]]:
+        """Parse 'show vlan brief' output"""
+        try:
             vlans = {}
             
-            lines = vlan_output.split('\n')
-            for line in lines:
-                if re.match(r'^\d+', line):
-                    parts = line.split()
+            for line in io.StringIO(vlan_output):
+                if line and line[0].isdigit():
+                    parts = line.split(None, 3)
                     if len(parts) >= 3:
-                        vlan_id = parts[0]
-                        vlan_name = parts[1]
-                        status = parts[2]
-                        
+                        vlan_id, vlan_name, status = parts[:3]
                         vlans[vlan_id] = {
                             'name': vlan_name,
                             'status': status,
@@ -443,7 +747,7 @@ class CiscoManager:
                 "exit"
             ]
             result = self.send_config_commands(commands)
-            logger.info(f"Interface {interface} set to {status}")
+            logger.info("Interface %s set to %s", interface, status)
             return result
         except Exception as e:
             raise CiscoManagerError(f"Failed to set interface status: {str(e)}")
@@ -457,7 +761,7 @@ class CiscoManager:
                 "exit"
             ]
             result = self.send_config_commands(commands)
-            logger.info(f"Interface {interface} VLAN set to {vlan_id}")
+            logger.info("Interface %s VLAN set to %s", interface, vlan_id)
             return result
         except Exception as e:
             raise CiscoManagerError(f"Failed to set interface VLAN: {str(e)}")
@@ -471,7 +775,7 @@ class CiscoManager:
                 "exit"
             ]
             result = self.send_config_commands(commands)
-            logger.info(f"Interface {interface} description set")
+            logger.info("Interface %s description set", interface)
             return result
         except Exception as e:
             raise CiscoManagerError(f"Failed to set interface description: {str(e)}")
@@ -485,7 +789,7 @@ class CiscoManager:
                 "exit"
             ]
             result = self.send_config_commands(commands)
-            logger.info(f"VLAN {vlan_id} ({vlan_name}) created")
+            logger.info("VLAN %s (%s) created", vlan_id, vlan_name)
             return result
         except Exception as e:
             raise CiscoManagerError(f"Failed to create VLAN: {str(e)}")
@@ -495,7 +799,7 @@ class CiscoManager:
         try:
             commands = [f"no vlan {vlan_id}"]
             result = self.send_config_commands(commands)
-            logger.info(f"VLAN {vlan_id} deleted")
+            logger.info("VLAN %s deleted", vlan_id)
             return result
         except Exception as e:
             raise CiscoManagerError(f"Failed to delete VLAN: {str(e)}")
@@ -521,21 +825,12 @@ class CiscoManager:
         """Get MAC address table"""
         try:
             output = self.send_command("show mac address-table")
-            mac_table = []
-            
-            for line in output.split('\n'):
-                line = line.strip()
-                if re.match(r'^\d+', line):
-                    parts = line.split()
-                    if len(parts) >= 4:
-                        mac_table.append({
-                            'vlan': parts[0],
-                            'mac_address': parts[1],
-                            'type': parts[2],
-                            'interface': parts[3]
-                        })
-            
-            return mac_table
+            return [{
+                'vlan': m[1],
+                'mac_address': m[2],
+                'type': m[3],
+                'interface': m[4]
+            } for m in _RE_MAC_ROW.finditer(output)]
         except Exception:
             return []
     
@@ -543,32 +838,28 @@ class CiscoManager:
         """Get ARP table"""
         try:
             output = self.send_command("show arp")
-            arp_table = []
-            
-            for line in output.split('\n'):
-                line = line.strip()
-                if re.match(r'Internet', line):
-                    parts = line.split()
-                    if len(parts) >= 6:
-                        arp_table.append({
-                            'address': parts[1],
-                            'age': parts[2],
-                            'mac_address': parts[3],
-                            'type': parts[4],
-                            'interface': parts[5]
-                        })
-            
-            return arp_table
+            return [{
+                'address': m[1],
+                'age': m[2],
+                'mac_address': m[3],
+                'type': m[4],
+                'interface': m[5]
+            } for m in _RE_ARP_ROW.finditer(output)]
         except Exception:
             return []
     
     def get_running_config(self) -> str:
         """Get running configuration"""
         try:
-            return self.send_command("show running-config")
+            return self._fetch_running_config()
         except Exception as e:
             raise CiscoManagerError(f"Failed to get running config: {str(e)}")
     
+    @_ttl_cached(RUNNING_CONFIG_CACHE_TTL)
+    def _fetch_running_config(self) -> str:
+        """Fetch running configuration, shared by get_running_config and backup_config"""
+        return self.send_command("show running-config")
+    
     def save_config(self) -> str:
         """Save running configuration to startup"""
         try:
@@ -581,17 +872,17 @@ class CiscoManager:
     def backup_config(self, filename: Optional[str] = None) -> str:
         """Backup device configuration"""
         try:
-            config = self.send_command("show running-config")
+            config = self._fetch_running_config().encode('utf-8', 'replace')
             
             if not filename:
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                timestamp = time.strftime('%Y%m%d_%H%M%S')
                 serial = self.device_info.get('serial', 'unknown')
                 filename = f"backup_{serial}_{timestamp}.txt"
             
-            with open(filename, 'w', encoding='utf-8') as f:
+            with open(filename, 'wb') as f:
                 f.write(config)
             
-            logger.info(f"Configuration backed up to {filename}")
+            logger.info("Configuration backed up to %s", filename)
             return filename
         except Exception as e:
             raise CiscoManagerError(f"Backup failed: {str(e)}")
@@ -601,51 +892,80 @@ class CiscoManager:
         try:
             output = self.send_command("show interfaces")
             interfaces = []
-            current_interface = None
+            headers = list(_RE_IFACE_HEADER.finditer(output))
             
-            for line in output.split('\n'):
-                line = line.strip()
+            for index, header in enumerate(headers):
+                # Counters are searched only within this interface's block
+                block_start = header.end()
+                block_end = headers[index + 1].start() if index + 1 < len(headers) else len(output)
                 
-                if line.startswith(('GigabitEthernet', 'FastEthernet', 'TenGigabitEthernet')):
-                    if current_interface:
-                        interfaces.append(current_interface)
-                    
-                    parts = line.split()
-                    interface_name = parts[0]
-                    status = 'up' if 'up' in line.lower() else 'down'
-                    
-                    current_interface = {
-                        'interface': interface_name,
-                        'status': status,
-                        'rx_packets': 0,
-                        'tx_packets': 0,
-                        'rx_bytes': 0,
-                        'tx_bytes': 0,
-                        'errors': 0
-                    }
+                current_interface = {
+                    'interface': header.group(1),
+                    'status': 'up' if 'up' in header.group(2).lower() else 'down',
+                    'rx_packets': 0,
+                    'tx_packets': 0,
+                    'rx_bytes': 0,
+                    'tx_bytes': 0,
+                    'errors': 0
+                }
+                
+                rx_match = _RE_PKTS_IN.search(output, block_start, block_end)
+                if rx_match:
+                    current_interface['rx_packets'] = int(rx_match.group(1))
+                    current_interface['rx_bytes'] = int(rx_match.group(2))
+                
+                tx_match = _RE_PKTS_OUT.search(output, block_start, block_end)
+                if tx_match:
+                    current_interface['tx_packets'] = int(tx_match.group(1))
+                    current_interface['tx_bytes'] = int(tx_match.group(2))
                 
-                elif current_interface:
-                    if 'packets input' in line:
-                        parts = line.split()
-                        if len(parts) >= 5:
-                            try:
-                                current_interface['rx_packets'] = int(parts[0])
-                                current_interface['rx_bytes'] = int(parts[3])
-                            except ValueError:
-                                pass
-                    
-                    elif 'packets output' in line:
-                        parts = line.split()
-                        if len(parts) >= 5:
-                            try:
-                                current_interface['tx_packets'] = int(parts[0])
-                                current_interface['tx_bytes'] = int(parts[3])
-                            except ValueError:
-                                pass
-            
-            if current_interface:
                 interfaces.append(current_interface)
             
             return interfaces
         except Exception:
             return []
+
+
+class CiscoFleet:
+    """Run the same operation against several devices in parallel"""
+    
+    def __init__(self, max_workers: int = 10):
+        """Initialize the worker pool shared by all fleet operations"""
+        self.pool = ThreadPoolExecutor(max_workers=max_workers)
+    
+    def run_on_all(self, hosts: List[Dict[str, Any]],
+                   fn: Callable[[CiscoManager], Any]) -> Dict[str, Any]:
+        """Call fn(manager) for every host; failed hosts map to their CiscoManagerError"""
+        futures = {self.pool.submit(self._run_one, params, fn): params['host'] for params in hosts}
+        results = {}
+        
+        for future in as_completed(futures):
+            host = futures[future]
+            try:
+                results[host] = future.result()
+            except Exception as e:
+                logger.error("Fleet operation failed on %s: %s", host, e)
+                results[host] = e if isinstance(e, CiscoManagerError) else CiscoManagerError(str(e))
+        
+        return results
+    
+    @staticmethod
+    def _run_one(params: Dict[str, Any], fn: Callable[[CiscoManager], Any]) -> Any:
+        """Connect one manager (reusing a pooled session when available) and run fn on it"""
+        manager = CiscoManager()
+        if not manager.connect(**params):
+            raise CiscoManagerError(manager.last_error)
+        try:
+            return fn(manager)
+        finally:
+            manager.disconnect(keep_alive=True)
+    
+    def shutdown(self):
+        """Wait for running operations and stop the worker threads"""
+        self.pool.shutdown(wait=True)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
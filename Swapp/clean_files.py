@@ -2,26 +2,56 @@
 """Clean null bytes from Python files"""
 
 import os
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+
+# Files above this size are rewritten chunk by chunk instead of in memory
+LARGE_FILE_SIZE = 64 * 1024 * 1024
+CHUNK_SIZE = 1024 * 1024
+
+def _strip_in_place(f, mm, size):
+    """Rewrite a mapped file without its null bytes, returns the number removed"""
+    clean_content = mm[:].replace(b'\x00', b'')
+    mm.close()
+    f.seek(0)
+    f.write(clean_content)
+    f.truncate()
+    return size - len(clean_content)
+
+def _strip_streamed(filename):
+    """Copy a large file without its null bytes in fixed-size chunks, returns the number removed"""
+    null_count = 0
+    temp_name = filename + '.tmp'
+    with open(filename, 'rb') as src, open(temp_name, 'wb') as dst:
+        while chunk := src.read(CHUNK_SIZE):
+            clean_chunk = chunk.replace(b'\x00', b'')
+            null_count += len(chunk) - len(clean_chunk)
+            dst.write(clean_chunk)
+    os.replace(temp_name, filename)
+    return null_count
 
 def clean_file(filename):
     """Clean null bytes from a file"""
     try:
-        # Read the file in binary mode
-        with open(filename, 'rb') as f:
-            content = f.read()
+        size = os.path.getsize(filename)
+        null_count = 0
+        
+        # Scan the mapped file first; clean files are never copied or rewritten
+        if size > 0:
+            with open(filename, 'r+b') as f:
+                mm = mmap.mmap(f.fileno(), 0)
+                if mm.find(b'\x00') == -1:
+                    mm.close()
+                elif size > LARGE_FILE_SIZE:
+                    mm.close()
+                    f.close()
+                    null_count = _strip_streamed(filename)
+                else:
+                    null_count = _strip_in_place(f, mm, size)
         
-        # Count null bytes
-        null_count = content.count(b'\x00')
-        print(f"{filename}: {len(content)} bytes, {null_count} null bytes")
+        print(f"{filename}: {size} bytes, {null_count} null bytes")
         
         if null_count > 0:
-            # Remove null bytes
-            clean_content = content.replace(b'\x00', b'')
-            
-            # Write back the clean content
-            with open(filename, 'wb') as f:
-                f.write(clean_content)
-            
             print(f"✅ Cleaned {null_count} null bytes from {filename}")
         else:
             print(f"✅ {filename} is already clean")
@@ -33,10 +63,16 @@ if __name__ == "__main__":
     # Clean Python files
     files_to_clean = ['cisco_manager.py', 'main.py', 'gui_components.py']
     
+    existing_files = []
     for filename in files_to_clean:
         if os.path.exists(filename):
-            clean_file(filename)
+            existing_files.append(filename)
         else:
             print(f"⚠️ File not found: {filename}")
     
+    # File I/O dominates, so threads overlap the reads and writes
+    if existing_files:
+        with ThreadPoolExecutor(max_workers=min(8, len(existing_files))) as executor:
+            list(executor.map(clean_file, existing_files))
+    
     print("\n🔧 File cleaning completed!") 
\ No newline at end of file
@@ -2,46 +2,53 @@
 """Fix encoding issues in Python files"""
 
 import os
-import codecs
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from charset_normalizer import from_bytes
+except ImportError:
+    from_bytes = None
+
+# Byte order marks and the codec that decodes (and drops) each of them
+BOM_ENCODINGS = (
+    (b'\xef\xbb\xbf', 'utf-8-sig'),
+    (b'\xff\xfe', 'utf-16'),
+    (b'\xfe\xff', 'utf-16'),
+)
+
+# Replacement characters and null bytes, dropped in a single translate pass
+_CLEAN_TABLE = str.maketrans('', '', '\ufffd\x00')
+
+def detect_and_decode(raw_content):
+    """Decode file bytes, returns (text, encoding name)"""
+    for bom, encoding in BOM_ENCODINGS:
+        if raw_content.startswith(bom):
+            return raw_content.decode(encoding, errors='replace'), encoding
+    
+    try:
+        return raw_content.decode('utf-8'), 'utf-8'
+    except UnicodeDecodeError:
+        pass
+    
+    if from_bytes is not None:
+        match = from_bytes(raw_content).best()
+        if match is not None:
+            return str(match), match.encoding
+    
+    return raw_content.decode('cp1252', errors='replace'), 'cp1252'
 
 def fix_encoding(filename):
     """Fix encoding issues in a file"""
     try:
-        # Try to read with different encodings
-        encodings = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252']
-        content = None
+        # Read once and decode in memory instead of re-opening per candidate encoding
+        with open(filename, 'rb') as f:
+            raw_content = f.read()
         
-        for encoding in encodings:
-            try:
-                with open(filename, 'r', encoding=encoding) as f:
-                    content = f.read()
-                print(f"✅ Successfully read {filename} with {encoding} encoding")
-                break
-            except:
-                continue
-        
-        if content is None:
-            # Try binary read and clean
-            with open(filename, 'rb') as f:
-                raw_content = f.read()
-            
-            # Remove BOM and problematic bytes
-            if raw_content.startswith(b'\xff\xfe'):
-                raw_content = raw_content[2:]
-            elif raw_content.startswith(b'\xfe\xff'):
-                raw_content = raw_content[2:]
-            elif raw_content.startswith(b'\xef\xbb\xbf'):
-                raw_content = raw_content[3:]
-            
-            # Try to decode as UTF-8, replacing problematic characters
-            try:
-                content = raw_content.decode('utf-8', errors='replace')
-            except:
-                content = raw_content.decode('latin-1', errors='replace')
+        content, encoding = detect_and_decode(raw_content)
+        print(f"✅ Successfully read {filename} with {encoding} encoding")
         
         # Clean up any remaining problematic characters
-        content = content.replace('\ufffd', '')  # Remove replacement characters
-        content = content.replace('\x00', '')   # Remove null bytes
+        content = content.translate(_CLEAN_TABLE)
         
         # Write back as clean UTF-8
         with open(filename, 'w', encoding='utf-8', newline='\n') as f:
@@ -56,10 +63,16 @@ if __name__ == "__main__":
     # Fix encoding for Python files
     files_to_fix = ['cisco_manager.py', 'main.py', 'gui_components.py']
     
+    existing_files = []
     for filename in files_to_fix:
         if os.path.exists(filename):
-            fix_encoding(filename)
+            existing_files.append(filename)
         else:
             print(f"⚠️ File not found: {filename}")
     
+    # File I/O dominates, so threads overlap the reads and writes
+    if existing_files:
+        with ThreadPoolExecutor(max_workers=min(8, len(existing_files))) as executor:
+            list(executor.map(fix_encoding, existing_files))
+    
     print("\n🔧 Encoding fix completed!") 
\ No newline at end of file
@@ -1,11 +1,144 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
-from datetime import datetime
 import threading
 import time
+import queue
+import collections
+import contextlib
+
+# Upper bound on port grid repaints per second; faster status updates are coalesced
+MAX_REDRAW_RATE = 10
+
+# Lines kept in the command terminal; older output is trimmed from the top
+TERMINAL_MAX_LINES = 5000
+# Distinct commands remembered for Up/Down history navigation
+TERMINAL_HISTORY_SIZE = 500
+
+# Static switch face layout: 4 groups of 12 ports, odd ports on the top row, even on the bottom
+PORTS_PER_GROUP = 12
+PORT_GROUPS = 4
+PORT_POSITIONS = tuple((0, (p - 1) // 2) if p % 2 else (1, (p - 2) // 2)
+                       for p in range(1, PORTS_PER_GROUP + 1))
+PORT_NUMBER_LABELS = tuple(str(n) for n in range(1, PORTS_PER_GROUP * PORT_GROUPS + 1))
+PORT_WIDTH, PORT_HEIGHT, PORT_GAP = 35, 25, 2
+GROUP_WIDTH = 6 * (PORT_WIDTH + PORT_GAP) + 20
+GROUP_LABELS = tuple(f"Ports {g * PORTS_PER_GROUP + 1}-{(g + 1) * PORTS_PER_GROUP}"
+                     for g in range(PORT_GROUPS))
+
+# Port details window text; filled with str.format_map from the port context
+STATUS_TEMPLATE = """
+🔌 Port: Gi1/0/{port_num}
+Status: {status}
+Administrative Status: up
+Operational Status: {status}
+Speed: {speed}
+Duplex: {duplex}
+VLAN: {vlan}
+Type: 10/100/1000BaseTX
+MAC Address: 00:1e:14:a4:33:0{port_num:02d}
+Last Input: 00:00:01
+Last Output: 00:00:00
+Input Packets: 15,234,567
+Output Packets: 12,345,678
+Input Errors: 0
+Output Errors: 0
+
+📈 Interface Counters:
+- Bytes Input: 1,234,567,890
+- Bytes Output: 987,654,321
+- Packets Input: 15,234,567
+- Packets Output: 12,345,678
+- Input Rate: 1000 bits/sec
+- Output Rate: 800 bits/sec
+
+🔧 Configuration:
+- Port Mode: Access
+- Access VLAN: {vlan}
+- Voice VLAN: None
+- Port Security: Disabled
+- Storm Control: Disabled
+
+📊 Raw Interface Data:
+{raw_line}
+"""
+
+CONFIG_TEMPLATE = """
+interface GigabitEthernet1/0/{port_num}
+ description User Port {port_num}
+ switchport mode access
+ switchport access vlan 1
+ spanning-tree portfast
+ spanning-tree bpduguard enable
+!
+"""
+
+STATS_TEMPLATE = """
+📊 Interface Statistics for Gi1/0/{port_num}:
+
+Input Statistics:
+  Total Packets: 15,234,567
+  Total Bytes: 1,234,567,890
+  Unicast: 14,000,000
+  Multicast: 1,200,000
+  Broadcast: 34,567
+  Input Errors: 0
+  CRC Errors: 0
+  Frame Errors: 0
+  Overruns: 0
+  Ignored: 0
+
+Output Statistics:
+  Total Packets: 12,345,678
+  Total Bytes: 987,654,321
+  Unicast: 11,000,000
+  Multicast: 1,300,000
+  Broadcast: 45,678
+  Output Errors: 0
+  Collisions: 0
+  Interface Resets: 0
+  Late Collisions: 0
+  Lost Carrier: 0
+  No Carrier: 0
+
+📈 Rate Information:
+  Input Rate: 1000 bits/sec, 1 packets/sec
+  Output Rate: 800 bits/sec, 1 packets/sec
+  5 minute input rate: 950 bits/sec, 1 packets/sec
+  5 minute output rate: 750 bits/sec, 1 packets/sec
+"""
+
+# Port hover tooltip text; unknown statuses get the yellow icon
+_STATUS_ICON_MAP = {'up': "🟢", 'connected': "🟢", 'down': "🔴", 'notconnect': "🔴"}
+TOOLTIP_TEMPLATE = """{status_icon} Port Gi1/0/{port_num}
+📊 Status: {status}
+🏷️  VLAN: {vlan}
+⚡ Speed: {speed}
+🔗 Duplex: {duplex}
+
+💡 Click for detailed controls"""
+
+# Row formatters for the device info tabs, bound once instead of parsed per row
+_INFO_ROW = "{key:<20}: {value}\n".format
+_TEMP_ROW = "{icon} {sensor:<15}: {temp}°C ({status})\n".format
+_STATUS_ROW = "{icon} {name:<15}: {status}\n".format
+_VLAN_ROW = "VLAN {vlan_id:<5}: {name:<20} ({status})\n".format
+
+@contextlib.contextmanager
+def _editable(widget):
+    """Temporarily unlock a read-only text widget"""
+    widget.config(state=tk.NORMAL)
+    try:
+        yield widget
+    finally:
+        widget.config(state=tk.DISABLED)
+
+def _fill_readonly_text(widget, template, ctx):
+    """Render a template into a text widget with one insert and lock it"""
+    widget.insert('1.0', template.format_map(ctx))
+    widget.config(state=tk.DISABLED)
 
 class ModernFrame(tk.Frame):
     """Modern styled frame with gradient-like appearance"""
@@ -35,6 +168,14 @@ class StatusBar(tk.Frame):
                                  bg='#34495e', fg='#bdc3c7', font=('Arial', 9))
         self.time_label.pack(side=tk.RIGHT, padx=10)
         
+        self._last_time_str = None
+        self._tick_id = None
+        
+        # Pause the clock while the main window is minimized
+        top = self.winfo_toplevel()
+        top.bind('<Map>', self._on_toplevel_map, add='+')
+        top.bind('<Unmap>', self._on_toplevel_unmap, add='+')
+        self.bind('<Destroy>', self._on_destroy, add='+')
         self.update_time()
     
     def update_connection_status(self, connected, device_info=None):
@@ -48,15 +189,38 @@ class StatusBar(tk.Frame):
             self.device_label.config(text="No Device")
     
     def update_time(self):
-        current_time = datetime.now().strftime('%H:%M:%S')
-        self.time_label.config(text=current_time)
-        self.after(1000, lambda: self.update_time())
+        current_time = time.strftime('%H:%M:%S')
+        # Only touch the label when the visible text changes
+        if current_time != self._last_time_str:
+            self._last_time_str = current_time
+            self.time_label.config(text=current_time)
+        self._tick_id = self.after(1000, self.update_time)
+    
+    def _on_toplevel_map(self, event):
+        # Children inherit the toplevel bind tag; only react to the window itself
+        if event.widget is self.winfo_toplevel() and self._tick_id is None:
+            self.update_time()
+    
+    def _on_toplevel_unmap(self, event):
+        if event.widget is self.winfo_toplevel() and self._tick_id is not None:
+            self.after_cancel(self._tick_id)
+            self._tick_id = None
+    
+    def _on_destroy(self, event):
+        # A tick firing after destruction would touch a dead label
+        if event.widget is self and self._tick_id is not None:
+            self.after_cancel(self._tick_id)
+            self._tick_id = None
 
 class ConnectionPanel(ModernFrame):
     """Advanced connection panel with multiple device support"""
     def __init__(self, parent, connect_callback=None):
         super().__init__(parent, bg_color='#34495e')
         self.connect_callback = connect_callback
+        # Worker threads never touch Tk; they hand results back through this queue
+        self._result_queue = queue.Queue()
+        self._drain_job = None
+        self.bind('<Destroy>', self._on_destroy, add='+')
         self.setup_ui()
     
     def setup_ui(self):
@@ -136,10 +300,30 @@ class ConnectionPanel(ModernFrame):
             
             self.connect_btn.config(state='disabled', text='Connecting...')
             threading.Thread(target=self._connect_thread, args=(connection_data,), daemon=True).start()
+            self._drain_job = self.after(50, self._drain_queue)
     
     def _connect_thread(self, connection_data):
-        success, message = self.connect_callback(connection_data)
-        self.after(0, self._connection_result, success, message)
+        try:
+            success, message = self.connect_callback(connection_data)
+        except Exception as e:
+            success, message = False, str(e)
+        self._result_queue.put((success, message))
+    
+    def _drain_queue(self):
+        """Poll the worker result queue from the Tk thread"""
+        try:
+            success, message = self._result_queue.get_nowait()
+        except queue.Empty:
+            self._drain_job = self.after(50, self._drain_queue)
+            return
+        self._drain_job = None
+        self._connection_result(success, message)
+    
+    def _on_destroy(self, event):
+        # Stop polling for a result nobody can display any more
+        if event.widget is self and self._drain_job is not None:
+            self.after_cancel(self._drain_job)
+            self._drain_job = None
     
     def _connection_result(self, success, message):
         if success:
@@ -179,11 +363,41 @@ class ConnectionPanel(ModernFrame):
 
 class PortVisualization(ModernFrame):
     """Advanced port visualization with real-time monitoring"""
+    # Realistic switch port colors as (fill, text colour, label) per reported status
+    _STATUS_UP = ('#00ff00', 'black', 'UP')        # Bright green for UP ports
+    _STATUS_DOWN = ('#ff0000', 'white', 'DOWN')    # Red for DOWN ports
+    _STATUS_DISABLED = ('#808080', 'white', 'DIS') # Gray for disabled ports
+    _STATUS_UNKNOWN = ('#ff8c00', 'black', '---')  # Orange/amber for unknown status
+    _STATUS_MAP = {
+        'up': _STATUS_UP,
+        'connected': _STATUS_UP,
+        'down': _STATUS_DOWN,
+        'notconnected': _STATUS_DOWN,
+        'notconnect': _STATUS_DOWN,
+        'disabled': _STATUS_DISABLED,
+        'administratively down': _STATUS_DISABLED,
+    }
+    
     def __init__(self, parent, port_count=48):
         super().__init__(parent, bg='#2c3e50')
         self.port_count = port_count
         self.port_widgets = []
         self.port_data = {}
+        self._pending_ports = {}
+        self._flush_job = None
+        self._stats_canvas = None
+        self._rng = np.random.default_rng()
+        
+        # Port grid canvas and the canvas item id -> port number map used by its bindings
+        self._port_canvas = None
+        self._item_to_port = {}
+        self.bind('<Destroy>', self._on_destroy, add='+')
+        
+        # A single tooltip window, built on the first hover and then reused
+        self._tooltip_show_id = None
+        self._tooltip_singleton = None
+        self._tooltip_label = None
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -214,24 +428,22 @@ class PortVisualization(ModernFrame):
                                   bg='#2c3e50', fg='white', selectcolor='#34495e')
         auto_check.pack(side=tk.LEFT, padx=10)
         
-        # Main container
+        # Main container; each view lives in its own frame, built on first use and kept
         self.main_container = tk.Frame(self, bg='#2c3e50')
         self.main_container.pack(fill=tk.BOTH, expand=True)
+        self._view_frames = {}
+        self._current_view = None
         
         # Create grid view by default
-        self.create_grid_view()
+        self.change_view()
         
         # Legend
         self.create_legend()
     
-    def create_grid_view(self):
+    def create_grid_view(self, parent):
         """Create realistic switch port layout (48 ports in 4 groups of 12)"""
-        # Clear existing widgets
-        for widget in self.main_container.winfo_children():
-            widget.destroy()
-        
         # Create main container with switch background
-        switch_frame = tk.Frame(self.main_container, bg='#1a1a1a', relief='solid', bd=2)
+        switch_frame = tk.Frame(parent, bg='#1a1a1a', relief='solid', bd=2)
         switch_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Switch title/model
@@ -242,108 +454,62 @@ class PortVisualization(ModernFrame):
                               bg='#1a1a1a', fg='white', font=('Arial', 14, 'bold'))
         model_label.pack()
         
-        # Port groups container
-        ports_container = tk.Frame(switch_frame, bg='#1a1a1a')
-        ports_container.pack(expand=True, fill=tk.BOTH, padx=20, pady=10)
+        # All 48 ports are drawn as items on one canvas instead of nested widgets
+        canvas_width = PORT_GROUPS * (GROUP_WIDTH + 10) + 10
+        canvas = tk.Canvas(switch_frame, bg='#1a1a1a', highlightthickness=0,
+                           width=canvas_width, height=128)
+        canvas.pack(expand=True, padx=20, pady=10)
         
         self.port_widgets = []
+        self._item_to_port = {}
         
         # Create 4 groups of 12 ports each (total 48 ports)
         # Layout: Group 1: Ports 1-12, Group 2: Ports 13-24, Group 3: Ports 25-36, Group 4: Ports 37-48
-        for group in range(4):
-            group_frame = tk.Frame(ports_container, bg='#2a2a2a', relief='solid', bd=1)
-            group_frame.grid(row=0, column=group, padx=5, pady=5, sticky='nsew')
-            
-            # Group label
-            start_port = group * 12 + 1
-            end_port = (group + 1) * 12
-            group_label = tk.Label(group_frame, text=f"Ports {start_port}-{end_port}", 
-                                 bg='#2a2a2a', fg='#cccccc', font=('Arial', 9, 'bold'))
-            group_label.pack(pady=5)
+        for group, group_text in enumerate(GROUP_LABELS):
+            gx = 10 + group * (GROUP_WIDTH + 10)
+            canvas.create_rectangle(gx, 5, gx + GROUP_WIDTH, 122, fill='#2a2a2a', outline='#444444')
+            canvas.create_text(gx + GROUP_WIDTH // 2, 18, text=group_text,
+                               fill='#cccccc', font=('Arial', 9, 'bold'))
             
-            # Create 2 rows of 6 ports each for this group
-            ports_grid = tk.Frame(group_frame, bg='#2a2a2a')
-            ports_grid.pack(padx=10, pady=5)
-            
-            # Create ports in Cisco physical layout: odd numbers top row, even numbers bottom row
+            # Cisco physical layout: odd numbers top row, even numbers bottom row
             # Top row: 1, 3, 5, 7, 9, 11    Bottom row: 2, 4, 6, 8, 10, 12
-            for local_port in range(1, 13):  # 1 to 12 within this group
-                port_num = group * 12 + local_port  # Global port number
-                
-                # Calculate grid position: odd ports top row, even ports bottom row
-                if local_port % 2 == 1:  # Odd numbers (1,3,5,7,9,11)
-                    row = 0  # Top row
-                    col = (local_port - 1) // 2  # Column 0-5
-                else:  # Even numbers (2,4,6,8,10,12)
-                    row = 1  # Bottom row
-                    col = (local_port - 2) // 2  # Column 0-5
-                
-                # Port frame with realistic switch port look
-                port_frame = tk.Frame(ports_grid, bg='#ff8c00', relief='solid', bd=1, 
-                                    width=35, height=25)  # Orange/amber default color
-                port_frame.grid(row=row, column=col, padx=1, pady=1)
-                port_frame.grid_propagate(False)
-                
-                # Port number label (small text below port)
-                port_label = tk.Label(ports_grid, text=str(port_num), 
-                                    bg='#2a2a2a', fg='white', font=('Arial', 7))
-                port_label.grid(row=row+3, column=col, pady=1)  # Row +3 to place below both port rows
-                
-                # Status text on the port
-                status_text = tk.Label(port_frame, text="---", 
-                                     bg='#ff8c00', fg='black', font=('Arial', 6, 'bold'))
-                status_text.place(relx=0.5, rely=0.5, anchor='center')
-                
-                # Bind click events
-                def make_click_handler(port_number):
-                    return lambda e: self.show_port_details(port_number)
-                
-                click_handler = make_click_handler(port_num)
-                port_frame.bind("<Button-1>", click_handler)
-                status_text.bind("<Button-1>", click_handler)
-                port_label.bind("<Button-1>", click_handler)
-                
-                # Bind hover events for tooltip
-                def make_tooltip_handler(port_number):
-                    return lambda e: self.show_port_tooltip(e, port_number)
+            group_base = group * PORTS_PER_GROUP
+            for local_index, (row, col) in enumerate(PORT_POSITIONS):
+                port_num = group_base + local_index + 1  # Global port number
+                x = gx + 10 + col * (PORT_WIDTH + PORT_GAP)
+                y = 32 + row * (PORT_HEIGHT + PORT_GAP)
                 
-                def hide_tooltip_handler(e):
-                    self.hide_port_tooltip()
+                # Port body with the orange/amber default color; only the rectangle takes events
+                rect_id = canvas.create_rectangle(x, y, x + PORT_WIDTH, y + PORT_HEIGHT,
+                                                  fill='#ff8c00', outline='black', tags=('port',))
+                text_id = canvas.create_text(x + PORT_WIDTH // 2, y + PORT_HEIGHT // 2, text='---',
+                                             fill='black', font=('Arial', 6, 'bold'), state='disabled')
                 
-                tooltip_handler = make_tooltip_handler(port_num)
+                # Port number below both port rows
+                label_id = canvas.create_text(x + PORT_WIDTH // 2, 96 + row * 14,
+                                              text=PORT_NUMBER_LABELS[port_num - 1],
+                                              fill='white', font=('Arial', 7), state='disabled')
                 
-                # Bind events to port frame and status text
-                for widget in [port_frame, status_text]:
-                    widget.bind("<Enter>", tooltip_handler)
-                    widget.bind("<Leave>", hide_tooltip_handler)
-                    # Also bind to mouse movement to ensure tooltips work properly
-                    widget.bind("<Motion>", lambda e, pn=port_num: self.on_port_motion(e, pn))
-                
-                # Also bind to label to ensure consistent behavior
-                port_label.bind("<Enter>", tooltip_handler)
-                port_label.bind("<Leave>", hide_tooltip_handler)
-                
-                # Store widget references
-            self.port_widgets.append({
-                'frame': port_frame,
-                'label': port_label,
-                    'status': status_text,
-                    'port_num': port_num
-            })
-        
-        # Configure grid weights for equal spacing
-        for i in range(4):
-            ports_container.grid_columnconfigure(i, weight=1)
+                self._item_to_port[rect_id] = port_num
+                self.port_widgets.append({
+                    'rect': rect_id,
+                    'text': text_id,
+                    'label': label_id,
+                    'port_num': port_num,
+                    'style': self._STATUS_UNKNOWN
+                })
+        
+        # One set of item bindings for every port
+        canvas.tag_bind('port', "<Button-1>", self._on_port_click)
+        canvas.tag_bind('port', "<Enter>", self._on_port_enter)
+        canvas.tag_bind('port', "<Leave>", lambda e: self.hide_port_tooltip())
+        self._port_canvas = canvas
     
-    def create_list_view(self):
+    def create_list_view(self, parent):
         """Create list view of ports"""
-        # Clear existing widgets
-        for widget in self.main_container.winfo_children():
-            widget.destroy()
-        
         # Create treeview
         columns = ('Port', 'Status', 'VLAN', 'Speed', 'Duplex', 'Type')
-        tree = ttk.Treeview(self.main_container, columns=columns, show='headings', height=15)
+        tree = ttk.Treeview(parent, columns=columns, show='headings', height=15)
         
         # Define headings
         for col in columns:
@@ -351,8 +517,8 @@ class PortVisualization(ModernFrame):
             tree.column(col, width=100)
         
         # Scrollbars
-        v_scrollbar = ttk.Scrollbar(self.main_container, orient="vertical", command=tree.yview)
-        h_scrollbar = ttk.Scrollbar(self.main_container, orient="horizontal", command=tree.xview)
+        v_scrollbar = ttk.Scrollbar(parent, orient="vertical", command=tree.yview)
+        h_scrollbar = ttk.Scrollbar(parent, orient="horizontal", command=tree.xview)
         tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
         
         # Pack
@@ -360,42 +526,54 @@ class PortVisualization(ModernFrame):
         v_scrollbar.grid(row=0, column=1, sticky='ns')
         h_scrollbar.grid(row=1, column=0, sticky='ew')
         
-        self.main_container.grid_rowconfigure(0, weight=1)
-        self.main_container.grid_columnconfigure(0, weight=1)
+        parent.grid_rowconfigure(0, weight=1)
+        parent.grid_columnconfigure(0, weight=1)
         
         self.port_tree = tree
+        self.refresh_port_list()
     
-    def create_statistics_view(self):
-        """Create statistics view with charts"""
-        # Clear existing widgets
-        for widget in self.main_container.winfo_children():
-            widget.destroy()
-        
-        # Create matplotlib figure
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
-        fig.patch.set_facecolor('#2c3e50')
+    def refresh_port_list(self):
+        """Reload the list view rows from port_data in one pass"""
+        tree = self.port_tree
+        rows = []
+        for port_num in sorted(self.port_data):
+            data = self.port_data[port_num]
+            details = data['details']
+            rows.append((str(port_num), (f"Gi1/0/{port_num}", data['status'],
+                                         details.get('vlan', ''), details.get('speed', ''),
+                                         details.get('duplex', ''), details.get('type', ''))))
+        
+        # Hide the columns while loading so Tk lays the tree out once, not once per row
+        tree.configure(displaycolumns=())
+        tree.delete(*tree.get_children())
+        insert = tree.tk.call
+        for iid, values in rows:
+            insert(tree._w, 'insert', '', 'end', '-id', iid, '-values', values)
+        tree.configure(displaycolumns='#all')
+    
+    def create_statistics_view(self, parent):
+        """Create statistics view with charts; refresh_statistics updates them in place"""
+        # Create matplotlib figure without registering it with pyplot's global figure manager
+        fig = Figure(figsize=(12, 8), facecolor='#2c3e50')
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         
         # Port status pie chart
-        statuses = ['Connected', 'Disconnected', 'Disabled', 'Error']
-        sizes = [15, 20, 10, 3]  # Sample data
-        colors = ['#27ae60', '#e74c3c', '#95a5a6', '#f39c12']
-        
-        ax1.pie(sizes, labels=statuses, colors=colors, autopct='%1.1f%%')
-        ax1.set_title('Port Status Distribution', color='white')
+        sizes = [15, 20, 10, 3]  # Sample data until ports report in
+        self._draw_status_pie(ax1, sizes)
         
         # VLAN distribution
         vlans = ['VLAN 1', 'VLAN 10', 'VLAN 20', 'VLAN 30']
         vlan_counts = [20, 15, 8, 5]
         
-        ax2.bar(vlans, vlan_counts, color='#3498db')
+        self._vlan_bars = ax2.bar(vlans, vlan_counts, color='#3498db')
         ax2.set_title('VLAN Distribution', color='white')
         ax2.tick_params(colors='white')
         
         # Traffic over time (sample data)
         time_points = list(range(24))
-        traffic_data = [np.random.randint(100, 1000) for _ in range(24)]
+        traffic_data = self._rng.integers(100, 1000, size=24)
         
-        ax3.plot(time_points, traffic_data, color='#e67e22', linewidth=2)
+        self._traffic_line, = ax3.plot(time_points, traffic_data, color='#e67e22', linewidth=2)
         ax3.set_title('Traffic Over Time (24h)', color='white')
         ax3.set_xlabel('Hour', color='white')
         ax3.set_ylabel('Packets/sec', color='white')
@@ -418,53 +596,156 @@ class PortVisualization(ModernFrame):
             ax.spines['left'].set_color('white')
         
         # Create canvas
-        canvas = FigureCanvasTkAgg(fig, self.main_container)
+        canvas = FigureCanvasTkAgg(fig, parent)
         canvas.draw()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        self._stats_fig = fig
+        self._stats_axes = (ax1, ax2, ax3, ax4)
+        self._status_sizes = sizes
+        self._stats_canvas = canvas
+    
+    def _draw_status_pie(self, ax, sizes):
+        """Draw the port status pie chart"""
+        statuses = ['Connected', 'Disconnected', 'Disabled', 'Error']
+        colors = ['#27ae60', '#e74c3c', '#95a5a6', '#f39c12']
+        
+        ax.pie(sizes, labels=statuses, colors=colors, autopct='%1.1f%%')
+        ax.set_title('Port Status Distribution', color='white')
+    
+    def refresh_statistics(self):
+        """Update the statistics charts from the current port data without rebuilding them"""
+        if self._stats_canvas is None or not self.port_data:
+            return
+        
+        ax1, ax2, ax3, ax4 = self._stats_axes
+        
+        # Port status pie: redrawn only when the counts change
+        sizes = [0, 0, 0, 0]
+        vlan_counts = {'1': 0, '10': 0, '20': 0, '30': 0}
+        for data in self.port_data.values():
+            status = str(data.get('status', '')).lower()
+            if status in ['up', 'connected']:
+                sizes[0] += 1
+            elif status in ['down', 'notconnected', 'notconnect']:
+                sizes[1] += 1
+            elif status in ['disabled', 'administratively down']:
+                sizes[2] += 1
+            else:
+                sizes[3] += 1
+            
+            vlan = str(data.get('details', {}).get('vlan', ''))
+            if vlan in vlan_counts:
+                vlan_counts[vlan] += 1
+        
+        if sizes != self._status_sizes:
+            ax1.clear()
+            ax1.set_facecolor('#34495e')
+            self._draw_status_pie(ax1, sizes)
+            self._status_sizes = sizes
+        
+        # VLAN bars keep their rectangles; only the heights move
+        for rect, count in zip(self._vlan_bars, vlan_counts.values()):
+            rect.set_height(count)
+        ax2.relim()
+        ax2.autoscale_view()
+        
+        # Traffic line (sample data)
+        self._traffic_line.set_ydata(self._rng.integers(100, 1000, size=24))
+        ax3.relim()
+        ax3.autoscale_view()
+        
+        self._stats_canvas.draw_idle()
     
     def change_view(self, event=None):
-        """Change visualization view"""
+        """Change visualization view by swapping cached view frames"""
         view = self.view_var.get()
-        if view == "Grid":
-            self.create_grid_view()
+        builders = {
+            "Grid": self.create_grid_view,
+            "List": self.create_list_view,
+            "Statistics": self.create_statistics_view
+        }
+        if view not in builders:
+            return
+        
+        frame = self._view_frames.get(view)
+        if frame is None:
+            frame = tk.Frame(self.main_container, bg='#2c3e50')
+            builders[view](frame)
+            self._view_frames[view] = frame
+        
+        if self._current_view is not None:
+            self._current_view.pack_forget()
+        frame.pack(fill=tk.BOTH, expand=True)
+        self._current_view = frame
+        
+        if view == "Statistics":
+            self.refresh_statistics()
         elif view == "List":
-            self.create_list_view()
-        elif view == "Statistics":
-            self.create_statistics_view()
+            self.refresh_port_list()
     
     def update_port_status(self, port_num, status, details=None):
-        """Update individual port status with realistic switch colors"""
-        if self.view_var.get() == "Grid" and port_num <= len(self.port_widgets):
+        """Update individual port status; the grid is repainted at most MAX_REDRAW_RATE times a second"""
+        # Store port data
+        self.port_data[port_num] = {
+            'status': status,
+            'details': details or {},
+            'last_update': time.monotonic()  # Only used for staleness checks
+        }
+        
+        # Keep only the latest status per port until the next repaint
+        self._pending_ports[port_num] = status
+        if self._flush_job is None:
+            self._flush_job = self.after(1000 // MAX_REDRAW_RATE, self._flush_port_updates)
+    
+    def _flush_port_updates(self):
+        """Repaint every port whose status changed since the last flush"""
+        self._flush_job = None
+        pending, self._pending_ports = self._pending_ports, {}
+        
+        # The grid is kept while other views are shown, so it is repainted even when hidden
+        for port_num, status in pending.items():
+            if port_num > len(self.port_widgets):
+                continue
             widget = self.port_widgets[port_num - 1]
             
-            # Realistic switch port colors
-            if status.lower() in ['up', 'connected']:
-                color = '#00ff00'  # Bright green for UP ports
-                text_color = 'black'
-                status_text = 'UP'
-            elif status.lower() in ['down', 'notconnected', 'notconnect']:
-                color = '#ff0000'  # Red for DOWN ports  
-                text_color = 'white'
-                status_text = 'DOWN'
-            elif status.lower() in ['disabled', 'administratively down']:
-                color = '#808080'  # Gray for disabled ports
-                text_color = 'white'
-                status_text = 'DIS'
-            else:
-                color = '#ff8c00'  # Orange/amber for unknown status
-                text_color = 'black'
-                status_text = '---'
+            style = self._STATUS_MAP.get(status.lower(), self._STATUS_UNKNOWN)
             
-            # Update port visual appearance
-            widget['frame'].config(bg=color)
-            widget['status'].config(bg=color, fg=text_color, text=status_text)
+            # Skip the Tk round trips when the port already looks like this
+            if widget['style'] == style:
+                continue
+            widget['style'] = style
+            color, text_color, status_text = style
             
-            # Store port data
-            self.port_data[port_num] = {
-                'status': status,
-                'details': details or {},
-                'last_update': datetime.now()
-            }
+            # Update port visual appearance
+            self._port_canvas.itemconfigure(widget['rect'], fill=color)
+            self._port_canvas.itemconfigure(widget['text'], fill=text_color, text=status_text)
+    
+    def _on_destroy(self, event):
+        """Cancel pending repaint and tooltip callbacks"""
+        if event.widget is not self:
+            return
+        for job in (self._flush_job, self._tooltip_show_id):
+            if job is not None:
+                self.after_cancel(job)
+        self._flush_job = self._tooltip_show_id = None
+    
+    def _port_under_pointer(self):
+        """Port number of the canvas item currently under the mouse, if any"""
+        items = self._port_canvas.find_withtag('current')
+        return self._item_to_port.get(items[0]) if items else None
+    
+    def _on_port_click(self, event):
+        """Open the details window of the clicked port"""
+        port_num = self._port_under_pointer()
+        if port_num:
+            self.show_port_details(port_num)
+    
+    def _on_port_enter(self, event):
+        """Schedule the tooltip of the hovered port"""
+        port_num = self._port_under_pointer()
+        if port_num:
+            self.show_port_tooltip(event, port_num)
     
     def show_port_details(self, port_num):
         """Show detailed port information with control options"""
@@ -474,6 +755,10 @@ class PortVisualization(ModernFrame):
         details_window.configure(bg='#2c3e50')
         details_window.resizable(True, True)
         
+        # Get actual port data if available
+        port_info = self.port_data.get(port_num, {})
+        port_details = port_info.get('details', {})
+        
         # Port header
         header_frame = tk.Frame(details_window, bg='#34495e')
         header_frame.pack(fill=tk.X, padx=10, pady=10)
@@ -569,254 +854,147 @@ class PortVisualization(ModernFrame):
         stats_frame = ttk.Frame(notebook)
         notebook.add(stats_frame, text="📈 Statistics")
         
-        # Sample data display
-        port_info = self.port_data.get(port_num, {})
+        # Sample data display; read-only text needs neither line wrapping nor undo tracking
         status_text = scrolledtext.ScrolledText(status_frame, height=12, width=70,
-                                               bg='#1e1e1e', fg='#00ff00', font=('Consolas', 9))
+                                               bg='#1e1e1e', fg='#00ff00', font=('Consolas', 9),
+                                               wrap='none', undo=False, autoseparators=False)
         status_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Get actual port data if available
-        port_details = port_info.get('details', {})
-        current_vlan = port_details.get('vlan', '1')
-        current_status = port_details.get('status', 'Unknown')
-        current_speed = port_details.get('speed', 'Unknown')
-        current_duplex = port_details.get('duplex', 'Unknown')
-        
-        sample_status = f"""
-🔌 Port: Gi1/0/{port_num}
-Status: {current_status}
-Administrative Status: up
-Operational Status: {current_status}
-Speed: {current_speed}
-Duplex: {current_duplex}
-VLAN: {current_vlan}
-Type: 10/100/1000BaseTX
-MAC Address: 00:1e:14:a4:33:0{port_num:02d}
-Last Input: 00:00:01
-Last Output: 00:00:00
-Input Packets: 15,234,567
-Output Packets: 12,345,678
-Input Errors: 0
-Output Errors: 0
-
-📈 Interface Counters:
-- Bytes Input: 1,234,567,890
-- Bytes Output: 987,654,321
-- Packets Input: 15,234,567
-- Packets Output: 12,345,678
-- Input Rate: 1000 bits/sec
-- Output Rate: 800 bits/sec
-
-🔧 Configuration:
-- Port Mode: Access
-- Access VLAN: {current_vlan}
-- Voice VLAN: None
-- Port Security: Disabled
-- Storm Control: Disabled
-
-📊 Raw Interface Data:
-{port_details.get('raw_line', 'No raw data available')}
-        """
-        
-        status_text.insert(tk.END, sample_status)
-        status_text.config(state=tk.DISABLED)
+        ctx = {
+            'port_num': port_num,
+            'vlan': current_vlan,
+            'status': port_details.get('status', 'Unknown'),
+            'speed': port_details.get('speed', 'Unknown'),
+            'duplex': port_details.get('duplex', 'Unknown'),
+            'raw_line': port_details.get('raw_line', 'No raw data available'),
+        }
+        _fill_readonly_text(status_text, STATUS_TEMPLATE, ctx)
         
         # Configuration tab content
         config_text = scrolledtext.ScrolledText(config_frame, height=12, width=70,
-                                               bg='#1e1e1e', fg='#00ff00', font=('Consolas', 9))
+                                               bg='#1e1e1e', fg='#00ff00', font=('Consolas', 9),
+                                               wrap='none', undo=False, autoseparators=False)
         config_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        sample_config = f"""
-interface GigabitEthernet1/0/{port_num}
- description User Port {port_num}
- switchport mode access
- switchport access vlan 1
- spanning-tree portfast
- spanning-tree bpduguard enable
-!
-        """
-        
-        config_text.insert(tk.END, sample_config)
-        config_text.config(state=tk.DISABLED)
+        _fill_readonly_text(config_text, CONFIG_TEMPLATE, ctx)
         
         # Statistics tab content
         stats_text = scrolledtext.ScrolledText(stats_frame, height=12, width=70,
-                                              bg='#1e1e1e', fg='#00ff00', font=('Consolas', 9))
+                                              bg='#1e1e1e', fg='#00ff00', font=('Consolas', 9),
+                                              wrap='none', undo=False, autoseparators=False)
         stats_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        sample_stats = f"""
-📊 Interface Statistics for Gi1/0/{port_num}:
-
-Input Statistics:
-  Total Packets: 15,234,567
-  Total Bytes: 1,234,567,890
-  Unicast: 14,000,000
-  Multicast: 1,200,000
-  Broadcast: 34,567
-  Input Errors: 0
-  CRC Errors: 0
-  Frame Errors: 0
-  Overruns: 0
-  Ignored: 0
-
-Output Statistics:
-  Total Packets: 12,345,678
-  Total Bytes: 987,654,321
-  Unicast: 11,000,000
-  Multicast: 1,300,000
-  Broadcast: 45,678
-  Output Errors: 0
-  Collisions: 0
-  Interface Resets: 0
-  Late Collisions: 0
-  Lost Carrier: 0
-  No Carrier: 0
-
-📈 Rate Information:
-  Input Rate: 1000 bits/sec, 1 packets/sec
-  Output Rate: 800 bits/sec, 1 packets/sec
-  5 minute input rate: 950 bits/sec, 1 packets/sec
-  5 minute output rate: 750 bits/sec, 1 packets/sec
-        """
-        
-        stats_text.insert(tk.END, sample_stats)
-        stats_text.config(state=tk.DISABLED)
+        _fill_readonly_text(stats_text, STATS_TEMPLATE, ctx)
         
         # Store references for control functions
         self.current_port_window = details_window
         self.current_port_num = port_num
     
     def show_port_tooltip(self, event, port_num):
-        """Show tooltip with port information"""
-        # Cancel any pending tooltip
-        if hasattr(self, 'tooltip_job'):
-            self.after_cancel(self.tooltip_job)
-        
-        # Hide any existing tooltip first
+        """Show tooltip with port information after a short hover"""
         self.hide_port_tooltip()
-        
-        def create_tooltip():
-            try:
-                # Double check that we still need to show tooltip
-                if not hasattr(self, 'tooltip_should_show') or not self.tooltip_should_show:
-                    return
-                
-                # Create tooltip window
-                self.tooltip = tk.Toplevel(self)
-                self.tooltip.wm_overrideredirect(True)
-                self.tooltip.configure(bg='#1a1a1a', relief='solid', bd=2)
-                
-                # Make tooltip stay on top but not grab focus
-                self.tooltip.attributes('-topmost', True)
-                
-                # Position tooltip near mouse but adjust if near screen edge
-                try:
-                    x = event.widget.winfo_rootx() + 25
-                    y = event.widget.winfo_rooty() + 25
-                    
-                    # Get screen dimensions
-                    screen_width = self.tooltip.winfo_screenwidth()
-                    screen_height = self.tooltip.winfo_screenheight()
-                    
-                    # Adjust position if tooltip would go off screen
-                    if x + 200 > screen_width:
-                        x = event.widget.winfo_rootx() - 200
-                    if y + 150 > screen_height:
-                        y = event.widget.winfo_rooty() - 150
-                    
-                    self.tooltip.geometry(f"+{x}+{y}")
-                except:
-                    # Fallback position
-                    self.tooltip.geometry(f"+{event.x_root + 20}+{event.y_root + 20}")
-                
-                # Get port data
-                port_data = self.port_data.get(port_num, {})
-                port_details = port_data.get('details', {})
-                
-                # Create tooltip content with better formatting
-                status = port_details.get('status', 'Unknown')
-                status_icon = "🟢" if status.lower() in ['up', 'connected'] else "🔴" if status.lower() in ['down', 'notconnect'] else "🟡"
-                
-                tooltip_text = f"""{status_icon} Port Gi1/0/{port_num}
-📊 Status: {status}
-🏷️  VLAN: {port_details.get('vlan', 'N/A')}
-⚡ Speed: {port_details.get('speed', 'N/A')}
-🔗 Duplex: {port_details.get('duplex', 'N/A')}
-
-💡 Click for detailed controls"""
-                
-                # Create main label with better styling
-                label = tk.Label(self.tooltip, text=tooltip_text,
-                               bg='#1a1a1a', fg='white', font=('Arial', 9),
-                               justify=tk.LEFT, padx=12, pady=8)
-                label.pack()
-                
-                # Add subtle border effect
-                self.tooltip.configure(highlightbackground='#3498db', highlightthickness=1)
-                
-            except Exception as e:
-                print(f"Tooltip error: {e}")
-                self.hide_port_tooltip()
-        
-        # Set flag to show tooltip and schedule creation with delay
-        self.tooltip_should_show = True
-        self.tooltip_job = self.after(500, create_tooltip)  # 500ms delay to avoid flashing
+        # 500ms delay to avoid flashing while the mouse sweeps across the grid
+        self._tooltip_show_id = self.after(500, self._show_tooltip_now, port_num,
+                                           event.x_root, event.y_root)
     
-    def hide_port_tooltip(self):
-        """Hide port tooltip immediately"""
+    def _get_tooltip(self):
+        """Return the shared tooltip window, creating it hidden on first use"""
+        if self._tooltip_singleton is None:
+            tooltip = tk.Toplevel(self)
+            tooltip.withdraw()
+            tooltip.wm_overrideredirect(True)
+            tooltip.configure(bg='#1a1a1a', relief='solid', bd=2,
+                              highlightbackground='#3498db', highlightthickness=1)
+            tooltip.attributes('-topmost', True)  # Stay on top but do not grab focus
+            self._tooltip_label = tk.Label(tooltip, bg='#1a1a1a', fg='white', font=('Arial', 9),
+                                           justify=tk.LEFT, padx=12, pady=8)
+            self._tooltip_label.pack()
+            self._tooltip_singleton = tooltip
+        return self._tooltip_singleton
+    
+    def _show_tooltip_now(self, port_num, x_root, y_root):
+        """Fill, position and reveal the shared tooltip window"""
+        self._tooltip_show_id = None
         try:
-            # Cancel any pending tooltip
-            if hasattr(self, 'tooltip_job'):
-                self.after_cancel(self.tooltip_job)
-                delattr(self, 'tooltip_job')
+            tooltip = self._get_tooltip()
             
-            # Set flag to not show tooltip
-            self.tooltip_should_show = False
+            # Position tooltip near mouse but adjust if near screen edge
+            x = x_root + 25
+            y = y_root + 25
+            if x + 200 > tooltip.winfo_screenwidth():
+                x = x_root - 200
+            if y + 150 > tooltip.winfo_screenheight():
+                y = y_root - 150
+            tooltip.wm_geometry(f"+{x}+{y}")
             
-            # Destroy existing tooltip
-            if hasattr(self, 'tooltip') and self.tooltip:
-                try:
-                    self.tooltip.destroy()
-                except:
-                    pass
-                self.tooltip = None
+            self._tooltip_label.configure(text=self._tooltip_text(port_num))
+            tooltip.deiconify()
         except Exception as e:
-            print(f"Hide tooltip error: {e}")
-        
-        # Ensure cleanup
-        if hasattr(self, 'tooltip'):
-            self.tooltip = None
+            print(f"Tooltip error: {e}")
+            self.hide_port_tooltip()
     
-    def on_port_motion(self, event, port_num):
-        """Handle mouse motion over port (helps with tooltip stability)"""
+    def _tooltip_text(self, port_num):
+        """Tooltip text for a port, formatted once per port data update"""
+        port_data = self.port_data.get(port_num)
+        if port_data is not None and '_tooltip_cache' in port_data:
+            return port_data['_tooltip_cache']
+        
+        port_details = (port_data or {}).get('details', {})
+        status = port_details.get('status', 'Unknown')
+        status_icon = _STATUS_ICON_MAP.get(status.lower(), "🟡")
+        text = TOOLTIP_TEMPLATE.format(
+            status_icon=status_icon,
+            port_num=port_num,
+            status=status,
+            vlan=port_details.get('vlan', 'N/A'),
+            speed=port_details.get('speed', 'N/A'),
+            duplex=port_details.get('duplex', 'N/A'),
+        )
+        # update_port_status replaces the dict, which drops the cached text with it
+        if port_data is not None:
+            port_data['_tooltip_cache'] = text
+        return text
+    
+    def _invalidate_tooltip_cache(self, port_num):
+        """Drop the cached tooltip text of a port whose settings were changed"""
+        port_data = self.port_data.get(port_num)
+        if port_data is not None:
+            port_data.pop('_tooltip_cache', None)
+    
+    def hide_port_tooltip(self):
+        """Hide port tooltip immediately"""
         try:
-            # If mouse is moving within the same port, no need to recreate tooltip
-            if hasattr(self, 'current_tooltip_port') and self.current_tooltip_port == port_num:
-                return
-            
-            # Store current port for motion tracking
-            self.current_tooltip_port = port_num
+            # Cancel any pending tooltip
+            if self._tooltip_show_id is not None:
+                self.after_cancel(self._tooltip_show_id)
+                self._tooltip_show_id = None
             
+            # Hide the shared tooltip window
+            if self._tooltip_singleton is not None:
+                self._tooltip_singleton.withdraw()
         except Exception as e:
-            print(f"Port motion error: {e}")
+            print(f"Hide tooltip error: {e}")
     
     def control_port(self, port_num, action):
         """Control port status"""
         # This will be called by main app through callback
         if hasattr(self, 'port_control_callback') and self.port_control_callback:
             self.port_control_callback(port_num, action)
+            self._invalidate_tooltip_cache(port_num)
     
     def set_port_vlan(self, port_num):
         """Set port VLAN"""
         vlan_id = self.vlan_entry.get().strip()
         if vlan_id and hasattr(self, 'port_vlan_callback') and self.port_vlan_callback:
             self.port_vlan_callback(port_num, vlan_id)
+            self._invalidate_tooltip_cache(port_num)
     
     def set_port_description(self, port_num):
         """Set port description"""
         description = self.desc_entry.get().strip()
         if description and hasattr(self, 'port_desc_callback') and self.port_desc_callback:
             self.port_desc_callback(port_num, description)
+            self._invalidate_tooltip_cache(port_num)
     
     def create_legend(self):
         """Create status legend"""
@@ -839,11 +1017,18 @@ Output Statistics:
 
 class CommandTerminal(ModernFrame):
     """Advanced command terminal with history and auto-completion"""
-    def __init__(self, parent, command_callback=None):
+    def __init__(self, parent, command_callback=None, max_lines=TERMINAL_MAX_LINES):
         super().__init__(parent, bg='#1e1e1e')
         self.command_callback = command_callback
-        self.command_history = []
+        self.max_lines = max_lines
+        self.command_history = collections.deque(maxlen=TERMINAL_HISTORY_SIZE)
+        self._history_set = set()
         self.history_index = -1
+        # Output is buffered and written to the text widget at most every 50 ms
+        self._pending_chunks = []
+        self._flush_job = None
+        self._color_tags = set()
+        self.bind('<Destroy>', self._on_destroy, add='+')
         self.setup_ui()
     
     def setup_ui(self):
@@ -896,9 +1081,12 @@ class CommandTerminal(ModernFrame):
         if not command:
             return
         
-        # Add to history
-        if command not in self.command_history:
+        # Add to history, forgetting the oldest command once the history is full
+        if command not in self._history_set:
+            if len(self.command_history) == self.command_history.maxlen:
+                self._history_set.discard(self.command_history[0])
             self.command_history.append(command)
+            self._history_set.add(command)
         self.history_index = len(self.command_history)
         
         # Display command
@@ -918,24 +1106,47 @@ class CommandTerminal(ModernFrame):
             self.add_output("No connection established.\n", color='#ff6b6b')
     
     def add_output(self, text, color='#00ff00'):
-        """Add text to terminal output"""
-        self.output_text.config(state=tk.NORMAL)
-        self.output_text.insert(tk.END, text)
-        
-        # Apply color to the last inserted text
-        if color != '#00ff00':
-            start_pos = f"{self.output_text.index(tk.END)}-{len(text)}c"
-            self.output_text.tag_add("colored", start_pos, tk.END)
-            self.output_text.tag_config("colored", foreground=color)
-        
-        self.output_text.config(state=tk.DISABLED)
-        self.output_text.see(tk.END)
+        """Queue text for the terminal output; chunks are written in batches"""
+        self._pending_chunks.append((text, color))
+        if self._flush_job is None:
+            self._flush_job = self.after(50, self._flush_output)
+    
+    def _flush_output(self):
+        """Write all queued chunks with a single state toggle and autoscroll"""
+        chunks, self._pending_chunks = self._pending_chunks, []
+        self._flush_job = None
+        if not chunks:
+            return
+        
+        with _editable(self.output_text) as text_widget:
+            for text, color in chunks:
+                if color == '#00ff00':
+                    text_widget.insert(tk.END, text)
+                    continue
+                # One tag per color, configured the first time the color is used
+                tag = f"fg_{color.lstrip('#')}"
+                if tag not in self._color_tags:
+                    text_widget.tag_configure(tag, foreground=color)
+                    self._color_tags.add(tag)
+                text_widget.insert(tk.END, text, tag)
+            
+            # Keep the widget bounded so inserts and scrolling do not slow down over a session
+            lines = int(text_widget.index('end-1c').split('.')[0])
+            if lines > self.max_lines:
+                text_widget.delete('1.0', f'{lines - self.max_lines + 1}.0')
+        text_widget.see(tk.END)
+    
+    def _on_destroy(self, event):
+        # A flush firing after destruction would write to a dead text widget
+        if event.widget is self and self._flush_job is not None:
+            self.after_cancel(self._flush_job)
+            self._flush_job = None
     
     def clear_terminal(self):
         """Clear terminal output"""
-        self.output_text.config(state=tk.NORMAL)
-        self.output_text.delete(1.0, tk.END)
-        self.output_text.config(state=tk.DISABLED)
+        self._pending_chunks = []
+        with _editable(self.output_text):
+            self.output_text.delete(1.0, tk.END)
         self.add_output("Terminal cleared.\n")
     
     def previous_command(self, event):
@@ -957,6 +1168,14 @@ class CommandTerminal(ModernFrame):
 
 class DeviceInfoPanel(ModernFrame):
     """Comprehensive device information display panel"""
+    # Tab order: (name, title); each tab's text widget is created the first time it is shown
+    TABS = (
+        ('basic', "📊 Basic Info"),
+        ('env', "🌡️ Environment"),       # Temperature, Power, Fans
+        ('vlan', "🏷️ VLANs"),
+        ('perf', "⚡ Performance"),      # CPU/Memory
+    )
+    
     def __init__(self, parent):
         super().__init__(parent, bg_color='#34495e')
         self.setup_ui()
@@ -966,49 +1185,48 @@ class DeviceInfoPanel(ModernFrame):
         self.notebook = ttk.Notebook(self)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Basic Info Tab
-        self.basic_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.basic_frame, text="📊 Basic Info")
-        
-        self.basic_text = scrolledtext.ScrolledText(
-            self.basic_frame, height=10, bg='#2c3e50', fg='white', font=('Consolas', 9),
-            relief='flat', bd=0
-        )
-        self.basic_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # Environment Tab (Temperature, Power, Fans)
-        self.env_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.env_frame, text="🌡️ Environment")
-        
-        self.env_text = scrolledtext.ScrolledText(
-            self.env_frame, height=10, bg='#2c3e50', fg='white', font=('Consolas', 9),
-            relief='flat', bd=0
-        )
-        self.env_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # VLAN Info Tab
-        self.vlan_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.vlan_frame, text="🏷️ VLANs")
+        # Tab frames are cheap; their ScrolledText widgets are built on first selection
+        self._tab_builders = {}
+        self._pending_data = {}
+        for index, (name, title) in enumerate(self.TABS):
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=title)
+            setattr(self, f"{name}_frame", frame)
+            setattr(self, f"{name}_text", None)
+            self._tab_builders[index] = name
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         
-        self.vlan_text = scrolledtext.ScrolledText(
-            self.vlan_frame, height=10, bg='#2c3e50', fg='white', font=('Consolas', 9),
-            relief='flat', bd=0
-        )
-        self.vlan_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # CPU/Memory Tab
-        self.perf_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.perf_frame, text="⚡ Performance")
-        
-        self.perf_text = scrolledtext.ScrolledText(
-            self.perf_frame, height=10, bg='#2c3e50', fg='white', font=('Consolas', 9),
-            relief='flat', bd=0
-        )
-        self.perf_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        # The first tab is visible straight away
+        self._build_tab(self._tab_builders.pop(0))
         
         # Default messages
         self.update_info("No device connected")
     
+    def _on_tab_changed(self, event=None):
+        name = self._tab_builders.pop(self.notebook.index('current'), None)
+        if name is not None:
+            self._build_tab(name)
+    
+    def _build_tab(self, name):
+        """Create a tab's text widget and show any text written while it was unbuilt"""
+        text_widget = scrolledtext.ScrolledText(
+            getattr(self, f"{name}_frame"), height=10, bg='#2c3e50', fg='white', font=('Consolas', 9),
+            relief='flat', bd=0
+        )
+        text_widget.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        setattr(self, f"{name}_text", text_widget)
+        if name in self._pending_data:
+            self._set_tab_text(name, self._pending_data.pop(name))
+    
+    def _set_tab_text(self, name, text):
+        """Replace a tab's text, or keep it until the tab is first shown"""
+        text_widget = getattr(self, f"{name}_text")
+        if text_widget is None:
+            self._pending_data[name] = text
+            return
+        with _editable(text_widget):
+            text_widget.replace('1.0', tk.END, text)
+    
     def update_info(self, device_info):
         """Update comprehensive device information display"""
         if isinstance(device_info, dict) and 'device_info' in device_info:
@@ -1020,23 +1238,16 @@ class DeviceInfoPanel(ModernFrame):
         else:
             # String message
             self.clear_all_tabs()
-            self.basic_text.config(state=tk.NORMAL)
-            self.basic_text.insert(tk.END, str(device_info))
-            self.basic_text.config(state=tk.DISABLED)
+            self._set_tab_text('basic', str(device_info))
     
     def update_basic_info(self, device_info):
         """Update basic device information"""
-        self.basic_text.config(state=tk.NORMAL)
-        self.basic_text.delete(1.0, tk.END)
+        parts = ["🖥️  DEVICE INFORMATION\n", "=" * 50 + "\n\n"]
         
-            info_text = "🖥️  DEVICE INFORMATION\n"
-        info_text += "=" * 50 + "\n\n"
+        for key, value in device_info.items():
+            parts.append(_INFO_ROW(key=key.upper(), value=value))
         
-            for key, value in device_info.items():
-            info_text += f"{key.upper():<20}: {value}\n"
-        
-        self.basic_text.insert(tk.END, info_text)
-        self.basic_text.config(state=tk.DISABLED)
+        self._set_tab_text('basic', ''.join(parts))
     
     def update_comprehensive_info(self, status_data):
         """Update comprehensive device status"""
@@ -1045,83 +1256,66 @@ class DeviceInfoPanel(ModernFrame):
             self.update_basic_info(status_data['device_info'])
         
         # Update Environment Info
-        self.env_text.config(state=tk.NORMAL)
-        self.env_text.delete(1.0, tk.END)
-        
-        env_text = "🌡️  ENVIRONMENT STATUS\n"
-        env_text += "=" * 50 + "\n\n"
+        parts = ["🌡️  ENVIRONMENT STATUS\n", "=" * 50 + "\n\n"]
         
         # Temperature
         if status_data.get('temperature'):
-            env_text += "🌡️ TEMPERATURE SENSORS:\n"
-            env_text += "-" * 30 + "\n"
+            parts.append("🌡️ TEMPERATURE SENSORS:\n")
+            parts.append("-" * 30 + "\n")
             for sensor, data in status_data['temperature'].items():
                 status_icon = "✅" if data['status'] == 'OK' else "❌"
-                env_text += f"{status_icon} {sensor:<15}: {data['temperature']}°C ({data['status']})\n"
-            env_text += "\n"
+                parts.append(_TEMP_ROW(icon=status_icon, sensor=sensor, temp=data['temperature'], status=data['status']))
+            parts.append("\n")
         
         # Power Supply
         if status_data.get('power'):
-            env_text += "🔌 POWER SUPPLIES:\n"
-            env_text += "-" * 30 + "\n"
+            parts.append("🔌 POWER SUPPLIES:\n")
+            parts.append("-" * 30 + "\n")
             for ps, data in status_data['power'].items():
                 status_icon = "✅" if data['status'] == 'OK' else "❌"
-                env_text += f"{status_icon} {ps:<15}: {data['status']}\n"
-            env_text += "\n"
+                parts.append(_STATUS_ROW(icon=status_icon, name=ps, status=data['status']))
+            parts.append("\n")
         
         # Fans
         if status_data.get('fans'):
-            env_text += "💨 FANS:\n"
-            env_text += "-" * 30 + "\n"
+            parts.append("💨 FANS:\n")
+            parts.append("-" * 30 + "\n")
             for fan, data in status_data['fans'].items():
                 status_icon = "✅" if data['status'] == 'OK' else "❌"
-                env_text += f"{status_icon} {fan:<15}: {data['status']}\n"
+                parts.append(_STATUS_ROW(icon=status_icon, name=fan, status=data['status']))
         
-        self.env_text.insert(tk.END, env_text)
-        self.env_text.config(state=tk.DISABLED)
+        self._set_tab_text('env', ''.join(parts))
         
         # Update VLAN Info
-        self.vlan_text.config(state=tk.NORMAL)
-        self.vlan_text.delete(1.0, tk.END)
-        
-        vlan_text = "🏷️  VLAN INFORMATION\n"
-        vlan_text += "=" * 50 + "\n\n"
+        parts = ["🏷️  VLAN INFORMATION\n", "=" * 50 + "\n\n"]
         
         if status_data.get('vlans'):
             for vlan_id, vlan_data in status_data['vlans'].items():
-                vlan_text += f"VLAN {vlan_id:<5}: {vlan_data['name']:<20} ({vlan_data['status']})\n"
+                parts.append(_VLAN_ROW(vlan_id=vlan_id, name=vlan_data['name'], status=vlan_data['status']))
                 if vlan_data.get('ports'):
-                    vlan_text += f"   Ports: {', '.join(vlan_data['ports'][:10])}"
+                    parts.append(f"   Ports: {', '.join(vlan_data['ports'][:10])}")
                     if len(vlan_data['ports']) > 10:
-                        vlan_text += f" ... (+{len(vlan_data['ports'])-10} more)"
-                    vlan_text += "\n"
-                vlan_text += "\n"
+                        parts.append(f" ... (+{len(vlan_data['ports'])-10} more)")
+                    parts.append("\n")
+                parts.append("\n")
         
-        self.vlan_text.insert(tk.END, vlan_text)
-        self.vlan_text.config(state=tk.DISABLED)
+        self._set_tab_text('vlan', ''.join(parts))
         
         # Update Performance Info
-        self.perf_text.config(state=tk.NORMAL)
-        self.perf_text.delete(1.0, tk.END)
-        
-        perf_text = "⚡  PERFORMANCE METRICS\n"
-        perf_text += "=" * 50 + "\n\n"
+        parts = ["⚡  PERFORMANCE METRICS\n", "=" * 50 + "\n\n"]
         
         if status_data.get('cpu_memory'):
             cpu_mem = status_data['cpu_memory']
-            perf_text += "🧠 CPU & MEMORY:\n"
-            perf_text += "-" * 30 + "\n"
-            perf_text += f"CPU Usage      : {cpu_mem.get('cpu_usage', 'N/A')}\n"
-            perf_text += f"Memory Usage   : {cpu_mem.get('memory_usage', 'N/A')}\n"
-            perf_text += f"Total Memory   : {cpu_mem.get('total_memory', 'N/A'):,} bytes\n"
-            perf_text += f"Used Memory    : {cpu_mem.get('used_memory', 'N/A'):,} bytes\n"
-        
-        self.perf_text.insert(tk.END, perf_text)
-        self.perf_text.config(state=tk.DISABLED)
+            parts.append("🧠 CPU & MEMORY:\n")
+            parts.append("-" * 30 + "\n")
+            parts.append(f"CPU Usage      : {cpu_mem.get('cpu_usage', 'N/A')}\n")
+            parts.append(f"Memory Usage   : {cpu_mem.get('memory_usage', 'N/A')}\n")
+            parts.append(f"Total Memory   : {cpu_mem.get('total_memory', 'N/A'):,} bytes\n")
+            parts.append(f"Used Memory    : {cpu_mem.get('used_memory', 'N/A'):,} bytes\n")
+        
+        self._set_tab_text('perf', ''.join(parts))
     
     def clear_all_tabs(self):
         """Clear all tab contents"""
-        for text_widget in [self.basic_text, self.env_text, self.vlan_text, self.perf_text]:
-            text_widget.config(state=tk.NORMAL)
-            text_widget.delete(1.0, tk.END)
-            text_widget.config(state=tk.DISABLED) 
\ No newline at end of file
+        for name, _ in self.TABS:
+            self._set_tab_text(name, "") 
\ No newline at end of file